@@ -7,9 +7,6 @@ Font Manager GitHub版本自动化测试脚本
 
 import sys
 import traceback
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # 使用非交互式后端
 
 def print_header(title):
     """打印测试标题"""
@@ -17,6 +14,17 @@ def print_header(title):
     print(f"🧪 {title}")
     print('='*50)
 
+_shared_setup = None
+
+def get_shared_setup():
+    """获取共享的FontManager实例和设置结果（多个测试复用，只执行一次setup）"""
+    global _shared_setup
+    if _shared_setup is None:
+        from font_manager import FontManager
+        fm = FontManager()
+        _shared_setup = (fm, fm.setup())
+    return _shared_setup
+
 def test_import():
     """测试1: 导入测试"""
     print("📦 测试1: 导入Font Manager...")
@@ -44,9 +52,7 @@ def test_font_manager_class():
     """测试3: FontManager类测试"""
     print("\n🏗️  测试3: FontManager类...")
     try:
-        from font_manager import FontManager
-        fm = FontManager()
-        result = fm.setup()
+        fm, result = get_shared_setup()
         if result.success:
             print(f"✅ FontManager类正常 - 使用字体: {result.font_used.name}")
             return True
@@ -61,9 +67,7 @@ def test_fontinfo_attributes():
     """测试4: FontInfo属性测试（关键bug修复验证）"""
     print("\n🐛 测试4: FontInfo属性测试（bug修复验证）...")
     try:
-        from font_manager import FontManager
-        fm = FontManager()
-        result = fm.setup()
+        fm, result = get_shared_setup()
         if result.success:
             # 测试修复的关键属性
             score = result.font_used.quality_score  # 这里之前是bug
@@ -89,6 +93,10 @@ def test_chinese_display():
     """测试5: 中文显示测试"""
     print("\n🎨 测试5: 中文显示测试...")
     try:
+        import matplotlib
+        matplotlib.use('Agg')  # 使用非交互式后端
+        import matplotlib.pyplot as plt
+        
         from font_manager import setup_chinese_font
         setup_chinese_font()
         
@@ -128,9 +136,7 @@ def test_backup_config():
     """测试6: 配置备份测试（另一个修复的bug）"""
     print("\n💾 测试6: 配置备份测试...")
     try:
-        from font_manager import FontManager
-        fm = FontManager()
-        result = fm.setup()
+        fm, result = get_shared_setup()
         if result.success:
             # 测试修复的backup_config方法
             backup_path = fm.backup_config("test_backup.json")
@@ -127,26 +127,21 @@ def create_demo_charts(fm):
     ax1.set_title('系统字体类型分布', fontsize=16, fontweight='bold')
     ax1.set_ylabel('字体数量', fontsize=12)
     
-    # 添加数值标签
-    for bar, count in zip(bars, font_counts):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{count}', ha='center', va='bottom', fontsize=11, fontweight='bold')
+    # 添加数值标签（bar_label一次标注所有柱子）
+    ax1.bar_label(bars, padding=2, fontsize=11, fontweight='bold')
     ax1.grid(True, alpha=0.3)
     
     # 图表2: 字体质量评分
     font_names = ['Hiragino Sans GB', 'PingFang SC', 'STHeiti', 'Arial Unicode MS', 'DejaVu Sans']
     quality_scores = [0.96, 0.85, 0.73, 0.58, 0.45]
     
-    ax2.barh(font_names, quality_scores, color='#FF6B6B', alpha=0.8)
+    hbars = ax2.barh(font_names, quality_scores, color='#FF6B6B', alpha=0.8)
     ax2.set_title('字体质量评分对比', fontsize=16, fontweight='bold')
     ax2.set_xlabel('质量评分', fontsize=12)
     ax2.set_xlim(0, 1.0)
     
     # 添加评分标签
-    for i, score in enumerate(quality_scores):
-        ax2.text(score + 0.02, i, f'{score:.2f}', 
-                va='center', fontsize=10, fontweight='bold')
+    ax2.bar_label(hbars, fmt='%.2f', padding=4, fontsize=10, fontweight='bold')
     ax2.grid(True, alpha=0.3, axis='x')
     
     # 图表3: 配置管理功能
@@ -184,7 +179,7 @@ def create_demo_charts(fm):
     
     # 保存图表
     output_path = 'comprehensive_demo.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
     plt.close()
     
     print(f"✅ 演示图表已保存: {output_path}")
@@ -7,6 +7,9 @@ Font Manager 演示脚本
 """
 
 import sys
+import functools
+import matplotlib as mpl
+mpl.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
@@ -16,9 +19,26 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from font_manager import FontManager
 
+# 演示数据常量：配色与固定种子的趋势数据（每次运行输出一致，便于对比）
+DEMO_COLORS = ('#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7')
+TREND_DAYS = np.arange(30)
+TREND_VALUES = np.random.default_rng(0).integers(10, 50, 30)
 
-def create_demo_chart_before():
-    """创建使用默认字体的图表（修复前）"""
+
+@functools.lru_cache(maxsize=1)
+def _get_font_manager():
+    """创建并设置字体管理器，所有演示共用同一实例（字体只检测一次）"""
+    fm = FontManager()
+    return fm, fm.setup()
+
+
+def create_demo_chart_before(ax):
+    """
+    创建使用默认字体的图表（修复前）
+    
+    Args:
+        ax: 绘图使用的坐标轴，与修复后图表共用同一个Figure
+    """
     print("📊 创建默认字体图表...")
     
     # 重置matplotlib配置
@@ -27,42 +47,45 @@ def create_demo_chart_before():
     # 创建测试数据
     languages = ['英语', '中文', '日语', '土耳其语', '西班牙语']
     counts = [258, 254, 209, 104, 9]
-    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
     
-    # 创建图表
-    fig, ax = plt.subplots(figsize=(10, 6))
-    bars = ax.bar(languages, counts, color=colors, alpha=0.8)
+    # 清空共用坐标轴后重新绘制（在字体设置之后清空，刻度标签才会使用新字体）
+    ax.clear()
+    bars = ax.bar(languages, counts, color=DEMO_COLORS, alpha=0.8)
     
     # 设置标题和标签
     ax.set_title('推文语言分布 - 默认字体', fontsize=16, fontweight='bold')
     ax.set_xlabel('语言', fontsize=12)
     ax.set_ylabel('推文数量', fontsize=12)
     
-    # 添加数值标签
-    for bar, count in zip(bars, counts):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{count}', ha='center', va='bottom', fontsize=10)
+    # 添加数值标签（bar_label一次标注所有柱子）
+    ax.bar_label(bars, padding=2, fontsize=10)
     
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
+    ax.figure.tight_layout()
     
     # 保存图表
     output_path = 'demo_before_font_fix.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    ax.figure.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
     
     print(f"✅ 默认字体图表已保存: {output_path}")
     return output_path
 
 
-def create_demo_chart_after():
-    """创建使用字体管理库的图表（修复后）"""
+def create_demo_chart_after(ax):
+    """
+    创建使用字体管理库的图表（修复后）
+    
+    Args:
+        ax: 绘图使用的坐标轴，与修复前图表共用同一个Figure
+    """
     print("📊 创建字体管理库图表...")
     
     # 使用字体管理库设置字体
-    fm = FontManager()
-    result = fm.setup()
+    fm, result = _get_font_manager()
+    
+    # 修复前图表调用了plt.rcdefaults()，重新应用已选字体
+    if result.font_used:
+        fm.setup_matplotlib_chinese(result.font_used.name)
     
     if result.success:
         print(f"✅ 字体设置成功: {result.font_used.name}")
@@ -72,11 +95,10 @@ def create_demo_chart_after():
     # 创建测试数据
     languages = ['英语', '中文', '日语', '土耳其语', '西班牙语']
     counts = [258, 254, 209, 104, 9]
-    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
     
-    # 创建图表
-    fig, ax = plt.subplots(figsize=(10, 6))
-    bars = ax.bar(languages, counts, color=colors, alpha=0.8)
+    # 清空共用坐标轴后重新绘制（在字体设置之后清空，刻度标签才会使用新字体）
+    ax.clear()
+    bars = ax.bar(languages, counts, color=DEMO_COLORS, alpha=0.8)
     
     # 设置标题和标签
     font_name = result.font_used.name if result.font_used else "默认字体"
@@ -84,19 +106,15 @@ def create_demo_chart_after():
     ax.set_xlabel('语言', fontsize=12)
     ax.set_ylabel('推文数量', fontsize=12)
     
-    # 添加数值标签
-    for bar, count in zip(bars, counts):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{count}', ha='center', va='bottom', fontsize=10)
+    # 添加数值标签（bar_label一次标注所有柱子）
+    ax.bar_label(bars, padding=2, fontsize=10)
     
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
+    ax.figure.tight_layout()
     
     # 保存图表
     output_path = 'demo_after_font_fix.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    ax.figure.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
     
     print(f"✅ 字体管理库图表已保存: {output_path}")
     return output_path
@@ -107,8 +125,7 @@ def create_comprehensive_demo():
     print("📊 创建综合演示图表...")
     
     # 使用字体管理库
-    fm = FontManager()
-    result = fm.setup()
+    fm, result = _get_font_manager()
     
     # 创建综合图表
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
@@ -116,23 +133,16 @@ def create_comprehensive_demo():
     # 图表1: 语言分布柱状图
     languages = ['英语', '中文', '日语', '土耳其语', '西班牙语']
     counts = [258, 254, 209, 104, 9]
-    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
     
-    bars = ax1.bar(languages, counts, color=colors, alpha=0.8)
+    bars = ax1.bar(languages, counts, color=DEMO_COLORS, alpha=0.8)
     ax1.set_title('推文语言分布', fontsize=14, fontweight='bold')
     ax1.set_ylabel('推文数量', fontsize=12)
     
-    for bar, count in zip(bars, counts):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{count}', ha='center', va='bottom', fontsize=10)
+    ax1.bar_label(bars, padding=2, fontsize=10)
     ax1.grid(True, alpha=0.3)
     
     # 图表2: 时间趋势线图
-    dates = np.arange(30)
-    values = np.random.randint(10, 50, 30)
-    
-    ax2.plot(dates, values, marker='o', linewidth=2, markersize=4, color='#FF6B6B')
+    ax2.plot(TREND_DAYS, TREND_VALUES, marker='o', linewidth=2, markersize=4, color='#FF6B6B')
     ax2.set_title('推文发布时间趋势', fontsize=14, fontweight='bold')
     ax2.set_xlabel('天数', fontsize=12)
     ax2.set_ylabel('推文数量', fontsize=12)
@@ -142,12 +152,11 @@ def create_comprehensive_demo():
     categories = ['点赞', '转发', '回复', '引用']
     values = [1250, 680, 420, 180]
     
-    ax3.bar(categories, values, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'], alpha=0.8)
+    bars3 = ax3.bar(categories, values, color=DEMO_COLORS[:4], alpha=0.8)
     ax3.set_title('互动类型分布', fontsize=14, fontweight='bold')
     ax3.set_ylabel('总数量', fontsize=12)
     
-    for i, v in enumerate(values):
-        ax3.text(i, v + 20, str(v), ha='center', va='bottom', fontsize=10)
+    ax3.bar_label(bars3, padding=2, fontsize=10)
     ax3.grid(True, alpha=0.3)
     
     # 图表4: 内容分类饼图
@@ -155,7 +164,7 @@ def create_comprehensive_demo():
     labels = ['风水占卜', '命理分析', '运势预测', '塔罗牌', '其他']
     
     wedges, texts, autotexts = ax4.pie(sizes, labels=labels, autopct='%1.1f%%', 
-                                       startangle=90, colors=colors)
+                                       startangle=90, colors=DEMO_COLORS)
     ax4.set_title('内容分类分布', fontsize=14, fontweight='bold')
     
     # 设置饼图文字样式
@@ -175,7 +184,7 @@ def create_comprehensive_demo():
     
     # 保存图表
     output_path = 'demo_comprehensive.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
     plt.close()
     
     print(f"✅ 综合演示图表已保存: {output_path}")
@@ -187,13 +196,12 @@ def show_font_info():
     print("\n🔍 字体管理库信息:")
     print("-" * 40)
     
-    fm = FontManager()
+    fm, result = _get_font_manager()
     
     # 显示平台信息
     print(f"运行平台: {fm.platform.value}")
     
     # 设置字体
-    result = fm.setup()
     print(f"字体设置: {'✅ 成功' if result.success else '❌ 失败'}")
     
     if result.font_used:
@@ -229,9 +237,13 @@ def main():
         print("\n📊 生成演示图表...")
         print("-" * 40)
         
-        # 创建对比图表
-        before_chart = create_demo_chart_before()
-        after_chart = create_demo_chart_after()
+        # 创建对比图表（两张图共用一个Figure，避免重复创建画布）
+        fig, ax = plt.subplots(figsize=(10, 6))
+        try:
+            before_chart = create_demo_chart_before(ax)
+            after_chart = create_demo_chart_after(ax)
+        finally:
+            plt.close(fig)
         
         # 创建综合演示
         comprehensive_chart = create_comprehensive_demo()
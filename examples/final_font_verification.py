@@ -5,8 +5,11 @@
 验证所有图表的中文字体显示效果
 """
 
+import matplotlib as mpl
+mpl.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
+import numpy as np
 import warnings
 import os
 import glob
@@ -15,19 +18,22 @@ from datetime import datetime
 # 忽略警告
 warnings.filterwarnings('ignore')
 
+# 演示数据常量：配色与固定种子的趋势数据（每次运行输出一致，便于对比）
+DEMO_COLORS = ('#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7')
+TREND_DAYS = np.arange(30)
+TREND_VALUES = np.random.default_rng(0).integers(10, 50, 30)
+
 def setup_chinese_font():
     """设置中文字体"""
-    try:
-        fm._rebuild()
-    except:
-        pass
-    
     chinese_fonts = ['Hiragino Sans GB', 'PingFang SC', 'STHeiti', 'Arial Unicode MS']
     available_fonts = []
     
+    # 直接使用matplotlib已加载的字体列表，无需重新扫描系统字体目录
+    font_paths = [font_entry.fname.replace(' ', '') for font_entry in fm.fontManager.ttflist]
+    
     for font_name in chinese_fonts:
-        font_files = [f for f in fm.findSystemFonts() if font_name.replace(' ', '') in f.replace(' ', '')]
-        if font_files:
+        compact_name = font_name.replace(' ', '')
+        if any(compact_name in font_path for font_path in font_paths):
             available_fonts.append(font_name)
             break
     
@@ -54,26 +60,18 @@ def create_final_verification_chart():
     # 测试1: 语言分布 - 与实际数据一致
     languages = ['英语', '中文', '日语', '土耳其语', '西班牙语'] if font_available else ['English', 'Chinese', 'Japanese', 'Turkish', 'Spanish']
     counts = [258, 254, 209, 104, 9]
-    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
     
-    bars = ax1.bar(languages, counts, color=colors, alpha=0.8)
+    bars = ax1.bar(languages, counts, color=DEMO_COLORS, alpha=0.8)
     ax1.set_title('推文语言分布 - 字体验证' if font_available else 'Tweet Language Distribution - Font Test', 
                   fontsize=16, fontweight='bold', pad=15)
     ax1.set_ylabel('推文数量' if font_available else 'Number of Tweets', fontsize=12, fontweight='bold')
     
-    # 添加数值标签
-    for bar, count in zip(bars, counts):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{count}', ha='center', va='bottom', fontsize=11, fontweight='bold')
+    # 添加数值标签（bar_label一次标注所有柱子）
+    ax1.bar_label(bars, padding=2, fontsize=11, fontweight='bold')
     ax1.grid(True, alpha=0.3)
     
     # 测试2: 时间分析
-    import numpy as np
-    dates = np.arange(30)
-    values = np.random.randint(10, 50, 30)
-    
-    ax2.plot(dates, values, marker='o', linewidth=2, markersize=4, color='#FF6B6B')
+    ax2.plot(TREND_DAYS, TREND_VALUES, marker='o', linewidth=2, markersize=4, color='#FF6B6B')
     ax2.set_title('时间趋势分析 - 字体验证' if font_available else 'Time Trend Analysis - Font Test', 
                   fontsize=16, fontweight='bold', pad=15)
     ax2.set_xlabel('天数' if font_available else 'Days', fontsize=12, fontweight='bold')
@@ -84,14 +82,13 @@ def create_final_verification_chart():
     categories = ['点赞', '转发', '回复', '引用'] if font_available else ['Likes', 'Retweets', 'Replies', 'Quotes']
     values = [1250, 680, 420, 180]
     
-    ax3.bar(categories, values, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'], alpha=0.8)
+    bars3 = ax3.bar(categories, values, color=DEMO_COLORS[:4], alpha=0.8)
     ax3.set_title('互动类型分布 - 字体验证' if font_available else 'Engagement Type Distribution - Font Test', 
                   fontsize=16, fontweight='bold', pad=15)
     ax3.set_ylabel('总数量' if font_available else 'Total Count', fontsize=12, fontweight='bold')
     
     # 添加数值标签
-    for i, v in enumerate(values):
-        ax3.text(i, v + 20, str(v), ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax3.bar_label(bars3, padding=2, fontsize=11, fontweight='bold')
     ax3.grid(True, alpha=0.3)
     
     # 测试4: 内容分析饼图
@@ -99,7 +96,7 @@ def create_final_verification_chart():
     labels = ['风水占卜', '命理分析', '运势预测', '塔罗牌', '其他'] if font_available else ['Fengshui', 'Fortune', 'Prediction', 'Tarot', 'Others']
     
     wedges, texts, autotexts = ax4.pie(sizes, labels=labels, autopct='%1.1f%%', 
-                                       startangle=90, colors=colors)
+                                       startangle=90, colors=DEMO_COLORS)
     ax4.set_title('内容分类分布 - 字体验证' if font_available else 'Content Category Distribution - Font Test', 
                   fontsize=16, fontweight='bold', pad=15)
     
@@ -121,7 +118,7 @@ def create_final_verification_chart():
     
     # 保存验证图表
     verification_file = '爬虫分析图表/final_font_verification.png'
-    plt.savefig(verification_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(verification_file, dpi=150, bbox_inches='tight', facecolor='white')
     plt.close()
     
     print(f"✅ 最终验证图表已保存: {verification_file}")
@@ -7,6 +7,8 @@
 """
 
 import sys
+import matplotlib as mpl
+mpl.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
@@ -83,11 +85,8 @@ def create_test_chart():
     ax.set_ylabel('评分', fontsize=12)
     ax.set_xlabel('技术领域', fontsize=12)
     
-    # 添加数值标签
-    for bar, value in zip(bars, values):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                f'{value}', ha='center', va='bottom', fontsize=11, fontweight='bold')
+    # 添加数值标签（bar_label一次标注所有柱子）
+    ax.bar_label(bars, padding=2, fontsize=11, fontweight='bold')
     
     # 设置样式
     ax.grid(True, alpha=0.3, linestyle='--')
@@ -3,11 +3,13 @@ mpl.use("Agg")
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from wordcloud import WordCloud
+from wordcloud import WordCloud, STOPWORDS
+from wordcloud.tokenization import process_tokens
 import jieba
 from collections import Counter
 import matplotlib.font_manager as fm
 import os
+import re
 
 # 优先使用本地 FontManager 一行初始化，启用 emoji 黑白后备，确保中文/emoji 同时可见
 try:
@@ -38,14 +40,17 @@ def get_chinese_font_path():
 
 # 数据预处理
 print("正在加载数据...")
-df = pd.read_csv('/Users/duting/Downloads/命理风水占卜🔮/fixed_twitter_data/specific_keywords_865_20250804_171510.csv')
+# 只读取分析用到的列，减少解析与内存开销
+used_columns = ['text', 'created_at', 'like_count', 'retweet_count', 'reply_count', 'author_is_verified', 'language']
+df = pd.read_csv('/Users/duting/Downloads/命理风水占卜🔮/fixed_twitter_data/specific_keywords_865_20250804_171510.csv',
+                 usecols=used_columns)
 df['created_at'] = pd.to_datetime(df['created_at'], format='%a %b %d %H:%M:%S %z %Y', errors='coerce')
 print(f"数据加载完成，共 {len(df)} 条推文")
 
 # 1. 提取风水相关推文
 fengshui_keywords = ['feng shui', '风水', '風水', '家居布局', '家相', '运势', '招财', '辟邪', '五行', '八卦']
-pattern = '|'.join(fengshui_keywords)
-fengshui_tweets = df[df['text'].str.contains(pattern, case=False, na=False)].copy()
+pattern = re.compile('|'.join(fengshui_keywords), re.IGNORECASE)
+fengshui_tweets = df[df['text'].str.contains(pattern, na=False)].copy()
 print(f"找到 {len(fengshui_tweets)} 条风水相关推文")
 
 # 2. 主题分类与意图分析
@@ -60,11 +65,17 @@ theme_data = {
               'intent': '文化传播', 'color': '#D62728'}
 }
 
+for data in theme_data.values():
+    data['pattern'] = re.compile('|'.join(data['keywords']), re.IGNORECASE)
+
+# 每个主题只对文本列做一次正则匹配，后续图表复用布尔掩码
+theme_masks = {
+    theme: fengshui_tweets['text'].str.contains(data['pattern'], na=False)
+    for theme, data in theme_data.items()
+}
+
 # 3. 主题频率统计
-theme_counts = {}
-for theme in theme_data:
-    theme_counts[theme] = len(fengshui_tweets[fengshui_tweets['text'].str.contains(
-        '|'.join(theme_data[theme]['keywords']), case=False, na=False)])
+theme_counts = {theme: int(theme_masks[theme].sum()) for theme in theme_data}
 
 # 4. 可视化设置
 plt.style.use('default')
@@ -90,8 +101,7 @@ for p in ax.patches:
 plt.subplot(3, 2, 2)
 interaction_data = []
 for theme in theme_data:
-    theme_tweets = fengshui_tweets[fengshui_tweets['text'].str.contains(
-        '|'.join(theme_data[theme]['keywords']), case=False, na=False)]
+    theme_tweets = fengshui_tweets[theme_masks[theme]]
     if len(theme_tweets) > 0:
         interaction_data.append({
             'Theme': theme,
@@ -112,12 +122,11 @@ if len(interaction_df) > 0:
 
 # 主题时间趋势
 plt.subplot(3, 2, (3,4))
-fengshui_tweets_with_date = fengshui_tweets.copy()
-fengshui_tweets_with_date['date'] = pd.to_datetime(fengshui_tweets_with_date['created_at']).dt.date
+# created_at 加载时已解析为 datetime，直接取日期（保持 datetime64，分组更快）
+fengshui_tweets['date'] = fengshui_tweets['created_at'].dt.normalize()
 trend_data = []
 for theme in theme_data:
-    theme_tweets = fengshui_tweets_with_date[fengshui_tweets_with_date['text'].str.contains(
-        '|'.join(theme_data[theme]['keywords']), case=False, na=False)]
+    theme_tweets = fengshui_tweets[theme_masks[theme]]
     if len(theme_tweets) > 0:
         trend = theme_tweets.groupby('date').size().reset_index(name='Count')
         trend['Theme'] = theme
@@ -135,8 +144,7 @@ if trend_data:
 plt.subplot(3, 2, 5)
 author_data = []
 for theme in theme_data:
-    theme_tweets = fengshui_tweets[fengshui_tweets['text'].str.contains(
-        '|'.join(theme_data[theme]['keywords']), case=False, na=False)]
+    theme_tweets = fengshui_tweets[theme_masks[theme]]
     if len(theme_tweets) > 0:
         commercial = len(theme_tweets[theme_tweets['author_is_verified'] == True])
         personal = len(theme_tweets[theme_tweets['author_is_verified'] == False])
@@ -157,8 +165,7 @@ if len(author_df) > 0:
 plt.subplot(3, 2, 6)
 lang_data = []
 for theme in theme_data:
-    theme_tweets = fengshui_tweets[fengshui_tweets['text'].str.contains(
-        '|'.join(theme_data[theme]['keywords']), case=False, na=False)]
+    theme_tweets = fengshui_tweets[theme_masks[theme]]
     if len(theme_tweets) > 0:
         lang_counts = theme_tweets['language'].value_counts().head(3)
         for lang, count in lang_counts.items():
@@ -174,28 +181,37 @@ if len(lang_df) > 0:
 
 plt.tight_layout()
 plt.savefig('/Users/duting/Downloads/命理风水占卜🔮/爬虫分析图表/风水主题分析图表.png', 
-            dpi=300, bbox_inches='tight')
+            dpi=150, bbox_inches='tight')
 # plt.show()  # 非交互环境不显示
 plt.close()
 
 # 词云分析
-def chinese_word_segmentation(text):
-    """中文分词处理"""
-    try:
-        seg_list = jieba.cut(str(text), cut_all=False)
-        return ' '.join(seg_list)
-    except:
-        return str(text)
+def count_segmented_words(texts):
+    """
+    中文分词并统计词频
+    
+    分词后按 WordCloud.process_text 的默认规则（collocations=False）处理：提取单词、
+    去掉结尾的 's、去除纯数字和停用词，再用 process_tokens 合并大小写与英文复数形式。
+    """
+    stopwords = {w.lower() for w in STOPWORDS}
+    words = []
+    for token in jieba.cut('\n'.join(texts), cut_all=False):
+        for word in re.findall(r"\w[\w']*", token):
+            if word.lower().endswith("'s"):
+                word = word[:-2]
+            if not word.isdigit() and word.lower() not in stopwords:
+                words.append(word)
+    word_counts, _ = process_tokens(words)
+    return word_counts
 
 print("正在生成词云...")
-all_text = ' '.join(fengshui_tweets['text'].astype(str))
-all_text = chinese_word_segmentation(all_text)
+word_freq = count_segmented_words(fengshui_tweets['text'].astype(str))
 
 font_path = get_chinese_font_path()
 wordcloud_kwargs = dict(width=1000, height=500, background_color='white', collocations=False, max_words=100)
 if font_path:
     wordcloud_kwargs['font_path'] = font_path
-wordcloud = WordCloud(**wordcloud_kwargs).generate(all_text)
+wordcloud = WordCloud(**wordcloud_kwargs).generate_from_frequencies(word_freq)
 
 plt.figure(figsize=(15, 8))
 plt.imshow(wordcloud, interpolation='bilinear')
@@ -203,7 +219,7 @@ plt.axis('off')
 plt.title('风水主题关键词词云', fontsize=16, fontweight='bold')
 plt.tight_layout()
 plt.savefig('/Users/duting/Downloads/命理风水占卜🔮/爬虫分析图表/风水主题词云.png', 
-            dpi=300, bbox_inches='tight')
+            dpi=150, bbox_inches='tight')
 # plt.show()
 plt.close()
 
@@ -30,10 +30,6 @@ Font Manager - 中文字体管理库
 许可: MIT License
 """
 
-from .core.manager import FontManager
-from .core.detector import FontDetector
-from .core.config import ConfigManager
-from .core.styles import StyleManager, FontStyleConfig
 from .core.models import FontInfo, FontSetupResult, ValidationReport
 from .core.exceptions import (
     FontManagerError,
@@ -72,9 +68,70 @@ __all__ = [
     "setup_matplotlib_chinese",
     "setup_matplotlib_chinese_robust",
     "get_available_fonts",
-    "validate_font_config"
+    "validate_font_config",
+    "reset_default_manager"
 ]
 
+# 延迟导入的重量级组件：名称 -> (模块, 属性)
+_LAZY_IMPORTS = {
+    "FontManager": (".core.manager", "FontManager"),
+    "FontDetector": (".core.detector", "FontDetector"),
+    "ConfigManager": (".core.config", "ConfigManager"),
+    "StyleManager": (".core.styles", "StyleManager"),
+    "FontStyleConfig": (".core.styles", "FontStyleConfig"),
+}
+
+
+def __getattr__(name: str):
+    """
+    首次访问时导入重量级组件并缓存到模块全局变量 (PEP 562)
+    
+    Args:
+        name: 属性名称
+        
+    Returns:
+        Any: 对应的类
+    """
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module_name, attr_name = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """列出模块属性（包含延迟导入的组件）"""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# 便捷函数共享的默认管理器，首次使用时创建
+_default_manager = None
+
+
+def _get_default_manager():
+    """
+    获取默认的FontManager实例（延迟创建，所有便捷函数共享）
+    
+    Returns:
+        FontManager: 默认字体管理器
+    """
+    global _default_manager
+    if _default_manager is None:
+        from .core.manager import FontManager
+        _default_manager = FontManager()
+    return _default_manager
+
+
+def reset_default_manager():
+    """
+    便捷函数：丢弃默认的FontManager实例，下次调用时重新创建
+    """
+    global _default_manager
+    _default_manager = None
+
+
 # 便捷函数
 def setup_chinese_font(force_rebuild: bool = False) -> FontSetupResult:
     """
@@ -86,7 +143,7 @@ def setup_chinese_font(force_rebuild: bool = False) -> FontSetupResult:
     Returns:
         FontSetupResult: 字体设置结果
     """
-    manager = FontManager()
+    manager = _get_default_manager()
     return manager.setup(force_rebuild=force_rebuild)
 
 def get_available_fonts():
@@ -96,7 +153,7 @@ def get_available_fonts():
     Returns:
         List[FontInfo]: 可用字体列表
     """
-    manager = FontManager()
+    manager = _get_default_manager()
     return manager.get_available_fonts()
 
 def validate_font_config() -> ValidationReport:
@@ -106,7 +163,7 @@ def validate_font_config() -> ValidationReport:
     Returns:
         ValidationReport: 验证报告
     """
-    manager = FontManager()
+    manager = _get_default_manager()
     return manager.validate()
 
 def setup_matplotlib_chinese(font_name: str = None, force_rebuild: bool = False) -> FontSetupResult:
@@ -120,7 +177,7 @@ def setup_matplotlib_chinese(font_name: str = None, force_rebuild: bool = False)
     Returns:
         FontSetupResult: 字体设置结果
     """
-    manager = FontManager()
+    manager = _get_default_manager()
     return manager.setup_matplotlib_chinese(font_name=font_name, force_rebuild=force_rebuild)
 
 def setup_matplotlib_chinese_robust(force_rebuild: bool = False) -> FontSetupResult:
@@ -139,5 +196,5 @@ def setup_matplotlib_chinese_robust(force_rebuild: bool = False) -> FontSetupRes
     Returns:
         FontSetupResult: 字体设置结果
     """
-    manager = FontManager()
+    manager = _get_default_manager()
     return manager.setup_matplotlib_chinese_robust(force_rebuild=force_rebuild)
\ No newline at end of file
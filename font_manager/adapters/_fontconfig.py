@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fontconfig Library Binding
+
+通过ctypes直接调用libfontconfig，避免每次启动fc-list子进程。
+"""
+
+import ctypes
+import ctypes.util
+from typing import List, Optional
+
+# FcSetName / FcResult 常量
+_FC_SET_SYSTEM = 0
+_FC_RESULT_MATCH = 0
+_FC_FILE = b"file"
+
+
+class _FcFontSet(ctypes.Structure):
+    """libfontconfig中的FcFontSet结构体"""
+    _fields_ = [
+        ("nfont", ctypes.c_int),
+        ("sfont", ctypes.c_int),
+        ("fonts", ctypes.POINTER(ctypes.c_void_p)),
+    ]
+
+
+def _load_library() -> Optional[ctypes.CDLL]:
+    """
+    加载libfontconfig并声明所需函数签名
+    
+    Returns:
+        Optional[ctypes.CDLL]: 加载成功返回库句柄，否则返回None
+    """
+    candidates = ["libfontconfig.so.1", ctypes.util.find_library("fontconfig")]
+    
+    for name in candidates:
+        if not name:
+            continue
+        try:
+            lib = ctypes.CDLL(name)
+        except OSError:
+            continue
+        
+        try:
+            lib.FcInitLoadConfigAndFonts.restype = ctypes.c_void_p
+            lib.FcInitLoadConfigAndFonts.argtypes = []
+            
+            lib.FcConfigGetFonts.restype = ctypes.POINTER(_FcFontSet)
+            lib.FcConfigGetFonts.argtypes = [ctypes.c_void_p, ctypes.c_int]
+            
+            lib.FcPatternGetString.restype = ctypes.c_int
+            lib.FcPatternGetString.argtypes = [
+                ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int,
+                ctypes.POINTER(ctypes.c_char_p)
+            ]
+            
+            lib.FcConfigDestroy.restype = None
+            lib.FcConfigDestroy.argtypes = [ctypes.c_void_p]
+            
+            lib.FcGetVersion.restype = ctypes.c_int
+            lib.FcGetVersion.argtypes = []
+        except AttributeError:
+            continue
+        
+        return lib
+    
+    return None
+
+
+_lib: Optional[ctypes.CDLL] = None
+_lib_loaded = False
+
+
+def get_library() -> Optional[ctypes.CDLL]:
+    """
+    获取libfontconfig句柄（首次调用时加载）
+    
+    Returns:
+        Optional[ctypes.CDLL]: 库句柄，不可用返回None
+    """
+    global _lib, _lib_loaded
+    if not _lib_loaded:
+        _lib = _load_library()
+        _lib_loaded = True
+    return _lib
+
+
+def is_available() -> bool:
+    """检查libfontconfig是否可用"""
+    return get_library() is not None
+
+
+def get_version() -> Optional[str]:
+    """
+    获取libfontconfig版本号
+    
+    Returns:
+        Optional[str]: 版本号 (如 "2.14.1")，库不可用返回None
+    """
+    lib = get_library()
+    if lib is None:
+        return None
+    
+    version = lib.FcGetVersion()
+    return f"{version // 10000}.{(version // 100) % 100}.{version % 100}"
+
+
+def list_font_files() -> Optional[List[str]]:
+    """
+    从fontconfig字体数据库读取所有字体文件路径
+    
+    Returns:
+        Optional[List[str]]: 字体文件路径列表，库不可用返回None
+    """
+    lib = get_library()
+    if lib is None:
+        return None
+    
+    config = lib.FcInitLoadConfigAndFonts()
+    if not config:
+        return None
+    
+    font_paths = []
+    try:
+        font_set = lib.FcConfigGetFonts(config, _FC_SET_SYSTEM)
+        if not font_set:
+            return font_paths
+        
+        fonts = font_set.contents.fonts
+        value = ctypes.c_char_p()
+        for i in range(font_set.contents.nfont):
+            if lib.FcPatternGetString(fonts[i], _FC_FILE, 0, ctypes.byref(value)) == _FC_RESULT_MATCH:
+                font_paths.append(value.value.decode('utf-8', errors='surrogateescape'))
+    finally:
+        lib.FcConfigDestroy(config)
+    
+    return font_paths
+
@@ -7,10 +7,11 @@ Platform Adapter Base Class
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 
 from ..core.models import FontInfo, Platform
+from ..utils.helpers import compile_keyword_pattern
 from ..utils.logger import LoggerMixin
 
 
@@ -22,6 +23,12 @@ class PlatformAdapter(ABC, LoggerMixin):
     每个平台的具体实现需要继承此类并实现抽象方法。
     """
     
+    # 超过此大小的字体视为中文字体（中文字体包含大量字形，通常较大）
+    CHINESE_FONT_SIZE_THRESHOLD = 5 * 1024 * 1024
+    
+    # 平台字体目录候选列表，由子类在__init__中设置
+    _system_font_dirs: List[Path] = []
+    
     def __init__(self, platform: Platform):
         """
         初始化平台适配器
@@ -31,6 +38,14 @@ class PlatformAdapter(ABC, LoggerMixin):
         """
         self.platform = platform
         self._font_cache: Dict[str, FontInfo] = {}
+        # 小写扩展名元组，供str.endswith一次匹配
+        self._ext_tuple = tuple(ext.lower() for ext in self.get_font_extensions())
+        # 所有中文关键词编译为一个正则，名称和路径各扫描一次
+        self._chinese_keyword_pattern = compile_keyword_pattern(
+            kw.lower() for kw in self.get_chinese_font_keywords()
+        )
+        # 已存在的字体目录，首次使用时检查，refresh_dirs重新检查
+        self._existing_font_dirs: Optional[Tuple[Path, ...]] = None
         
         self.logger.info(f"PlatformAdapter initialized for {platform.value}")
     
@@ -54,15 +69,20 @@ class PlatformAdapter(ABC, LoggerMixin):
         """
         pass
     
-    @abstractmethod
     def get_font_directories(self) -> List[Path]:
         """
-        获取系统字体目录列表
+        获取系统字体目录列表（仅包含存在的目录）
         
         Returns:
             List[Path]: 字体目录路径列表
         """
-        pass
+        if self._existing_font_dirs is None:
+            self.refresh_dirs()
+        return list(self._existing_font_dirs)
+    
+    def refresh_dirs(self):
+        """重新检查字体目录是否存在（目录在运行期间新建或删除时调用）"""
+        self._existing_font_dirs = tuple(d for d in self._system_font_dirs if d.exists())
     
     @abstractmethod
     def get_font_config_paths(self) -> List[Path]:
@@ -186,33 +206,31 @@ class PlatformAdapter(ABC, LoggerMixin):
         # 默认实现：返回空字典
         return {}
     
-    def is_chinese_font(self, font_name: str, font_path: Path) -> bool:
+    def is_chinese_font(self, font_name: str, font_path: Path, file_size: Optional[int] = None) -> bool:
         """
         判断是否为中文字体
         
         Args:
             font_name: 字体名称
             font_path: 字体文件路径
+            file_size: 已知的文件大小，为None时读取文件状态
             
         Returns:
             bool: 是否为中文字体
         """
         # 通过关键词判断
-        keywords = self.get_chinese_font_keywords()
-        name_lower = font_name.lower()
-        path_lower = str(font_path).lower()
-        
-        for keyword in keywords:
-            if keyword in name_lower or keyword in path_lower:
-                return True
+        pattern = self._chinese_keyword_pattern
+        if pattern.search(font_name.lower()) or pattern.search(str(font_path).lower()):
+            return True
         
         # 通过文件大小判断（中文字体通常较大）
-        try:
-            file_size = font_path.stat().st_size
-            if file_size > 5 * 1024 * 1024:  # 大于5MB
-                return True
-        except (OSError, IOError):
-            pass
+        if file_size is None:
+            try:
+                file_size = font_path.stat().st_size
+            except (OSError, IOError):
+                file_size = 0
+        if file_size > self.CHINESE_FONT_SIZE_THRESHOLD:  # 大于5MB
+            return True
         
         # 平台特定的判断逻辑
         return self.is_chinese_font_platform_specific(font_name, font_path)
@@ -306,19 +324,12 @@ class PlatformAdapter(ABC, LoggerMixin):
         """
         try:
             import matplotlib.pyplot as plt
-            import matplotlib.font_manager as fm
             
-            # 设置字体
+            # 设置字体（只修改rcParams，无需重建matplotlib字体缓存）
             font_list = [font_name] + self.get_fallback_fonts()
             plt.rcParams['font.sans-serif'] = font_list
             plt.rcParams['axes.unicode_minus'] = False
             
-            # 清理字体缓存
-            try:
-                fm._rebuild()
-            except:
-                pass
-            
             self.logger.info(f"matplotlib字体配置成功: {font_name}")
             return True
             
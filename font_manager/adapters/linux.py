@@ -6,13 +6,145 @@ Linux Platform Adapter
 Linux平台字体适配器，处理Linux系统特定的字体管理。
 """
 
+import functools
 import os
 import subprocess
 from typing import List, Dict, Optional, Set
 from pathlib import Path
 
 from ..core.models import Platform
+from ..utils.helpers import compile_keyword_pattern, filter_existing_files, iter_files_by_extension
 from .base import PlatformAdapter
+from . import _fontconfig
+
+
+# 系统环境信息在进程生命周期内不变，查询结果缓存在模块级别
+@functools.lru_cache(maxsize=1)
+def _get_fontconfig_info() -> Dict[str, str]:
+    """
+    获取fontconfig配置信息
+    
+    Returns:
+        Dict[str, str]: fontconfig信息
+    """
+    info = {}
+    
+    # 优先直接读取库版本，无需启动子进程
+    version = _fontconfig.get_version()
+    if version:
+        info['fontconfig_version'] = version
+        return info
+    
+    try:
+        # 获取fontconfig版本（fc-cache与fc-list来自同一fontconfig，只需查询一次）
+        result = subprocess.run(
+            ['fc-list', '--version'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        
+        if result.returncode == 0:
+            # fc-list将版本信息输出到stderr
+            info['fontconfig_version'] = (result.stdout or result.stderr).strip()
+    
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+        pass
+    
+    return info
+
+
+@functools.lru_cache(maxsize=1)
+def _get_system_language() -> str:
+    """
+    获取Linux系统语言设置
+    
+    Returns:
+        str: 系统语言代码
+    """
+    # 按POSIX优先级检查环境变量
+    for var in ('LC_ALL', 'LC_MESSAGES', 'LANG'):
+        lang = os.environ.get(var)
+        if lang:
+            return lang.split('.', 1)[0].split('@', 1)[0]  # 移除编码和修饰符部分
+    
+    # 备用方案（getdefaultlocale已在Python 3.11中弃用）
+    import locale
+    try:
+        return locale.getlocale(locale.LC_CTYPE)[0] or 'en_US'
+    except (ValueError, locale.Error):
+        return 'en_US'
+
+
+@functools.lru_cache(maxsize=1)
+def _get_desktop_environment() -> str:
+    """
+    获取桌面环境信息
+    
+    Returns:
+        str: 桌面环境名称
+    """
+    # 检查常见的桌面环境变量
+    desktop_vars = [
+        'XDG_CURRENT_DESKTOP',
+        'DESKTOP_SESSION',
+        'GDMSESSION'
+    ]
+    
+    for var in desktop_vars:
+        desktop = os.environ.get(var)
+        if desktop:
+            return desktop.lower()
+    
+    # 检查进程：直接读取/proc/<pid>/comm，无需启动ps子进程
+    try:
+        with os.scandir('/proc') as it:
+            for entry in it:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(os.path.join(entry.path, 'comm'), 'r') as f:
+                        name = f.read().strip().lower()
+                except OSError:
+                    continue
+                
+                if name in ('gnome-shell', 'gnome-session', 'gnome-session-b'):
+                    return 'gnome'
+                elif name in ('plasmashell', 'kded5', 'kded6', 'ksmserver', 'kwin_x11', 'kwin_wayland'):
+                    return 'kde'
+                elif name.startswith('xfce'):
+                    return 'xfce'
+                elif name.startswith('lxsession') or name.startswith('lxpanel'):
+                    return 'lxde'
+    
+    except OSError:
+        pass
+    
+    return 'unknown'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_os_release() -> Dict[str, str]:
+    """
+    解析/etc/os-release为字典（只读取一次）
+    
+    Returns:
+        Dict[str, str]: 发行版信息字段
+    """
+    os_release = {}
+    
+    try:
+        with open('/etc/os-release', 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                os_release[key] = value.strip('"\'')
+    except OSError:
+        pass
+    
+    return os_release
 
 
 class LinuxAdapter(PlatformAdapter):
@@ -22,6 +154,14 @@ class LinuxAdapter(PlatformAdapter):
     处理Linux系统的字体检测、配置和管理。
     """
     
+    # Linux特定的中文字体
+    _CHINESE_FONTS = frozenset({
+        'noto sans cjk', 'source han sans', 'wenquanyi',
+        'droid sans fallback', 'ar pl uming', 'ar pl ukai',
+        'fireflysung', 'wqy'
+    })
+    _CHINESE_FONT_PATTERN = compile_keyword_pattern(_CHINESE_FONTS)
+    
     def __init__(self):
         """初始化Linux适配器"""
         super().__init__(Platform.LINUX)
@@ -56,23 +196,15 @@ class LinuxAdapter(PlatformAdapter):
         if fc_list_fonts:
             font_paths.extend(fc_list_fonts)
         else:
-            # 备用方案：直接扫描字体目录
+            # 备用方案：直接扫描字体目录（单次遍历匹配所有扩展名）
             for font_dir in self.get_font_directories():
-                if not font_dir.exists():
-                    continue
-                
                 try:
-                    for ext in self.get_font_extensions():
-                        pattern = f"**/*{ext}"
-                        font_files = font_dir.glob(pattern)
-                        font_paths.extend([str(f) for f in font_files if f.is_file()])
-                        
+                    font_paths.extend(iter_files_by_extension(font_dir, self._ext_tuple))
                 except Exception as e:
                     self.logger.warning(f"扫描字体目录失败 {font_dir}: {e}")
         
         # 去重并排序
-        font_paths = list(set(font_paths))
-        font_paths.sort()
+        font_paths = sorted(set(font_paths))
         
         self.logger.info(f"Linux系统找到 {len(font_paths)} 个字体文件")
         return font_paths
@@ -81,9 +213,18 @@ class LinuxAdapter(PlatformAdapter):
         """
         使用fc-list命令获取字体列表
         
+        优先直接查询libfontconfig的字体数据库，仅在库无法加载时
+        才退回到fc-list子进程。
+        
         Returns:
             List[str]: fc-list返回的字体路径列表
         """
+        # fontconfig已校验过文件，无需逐个os.path.exists
+        fc_fonts = _fontconfig.list_font_files()
+        if fc_fonts is not None:
+            self.logger.info(f"fontconfig找到 {len(fc_fonts)} 个字体")
+            return fc_fonts
+        
         font_paths = []
         
         try:
@@ -96,11 +237,9 @@ class LinuxAdapter(PlatformAdapter):
             )
             
             if result.returncode == 0:
-                # 解析输出
-                for line in result.stdout.strip().split('\n'):
-                    font_path = line.strip()
-                    if font_path and os.path.exists(font_path):
-                        font_paths.append(font_path)
+                # 解析输出，按目录批量过滤不存在的文件
+                candidates = [line.strip() for line in result.stdout.split('\n') if line.strip()]
+                font_paths = filter_existing_files(candidates)
                         
                 self.logger.info(f"fc-list找到 {len(font_paths)} 个字体")
             else:
@@ -131,15 +270,6 @@ class LinuxAdapter(PlatformAdapter):
             'DejaVu Sans'            # 备用字体
         ]
     
-    def get_font_directories(self) -> List[Path]:
-        """
-        获取Linux字体目录列表
-        
-        Returns:
-            List[Path]: 字体目录路径列表
-        """
-        return [d for d in self._system_font_dirs if d.exists()]
-    
     def get_font_config_paths(self) -> List[Path]:
         """
         获取Linux字体配置文件路径
@@ -181,19 +311,7 @@ class LinuxAdapter(PlatformAdapter):
         Returns:
             bool: 是否为中文字体
         """
-        # Linux特定的中文字体
-        linux_chinese_fonts = {
-            'noto sans cjk', 'source han sans', 'wenquanyi',
-            'droid sans fallback', 'ar pl uming', 'ar pl ukai',
-            'fireflysung', 'wqy'
-        }
-        
-        name_lower = font_name.lower()
-        for chinese_font in linux_chinese_fonts:
-            if chinese_font in name_lower:
-                return True
-        
-        return False
+        return self._CHINESE_FONT_PATTERN.search(font_name.lower()) is not None
     
     def get_fontconfig_info(self) -> Dict[str, str]:
         """
@@ -202,35 +320,7 @@ class LinuxAdapter(PlatformAdapter):
         Returns:
             Dict[str, str]: fontconfig信息
         """
-        info = {}
-        
-        try:
-            # 获取fontconfig版本
-            result = subprocess.run(
-                ['fc-list', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                info['fontconfig_version'] = result.stdout.strip()
-            
-            # 获取字体缓存信息
-            result = subprocess.run(
-                ['fc-cache', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                info['fc_cache_version'] = result.stdout.strip()
-                
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-            pass
-        
-        return info
+        return dict(_get_fontconfig_info())
     
     def rebuild_font_cache(self) -> bool:
         """
@@ -265,19 +355,7 @@ class LinuxAdapter(PlatformAdapter):
         Returns:
             str: 系统语言代码
         """
-        try:
-            # 检查环境变量
-            for var in ['LANG', 'LC_ALL', 'LC_MESSAGES']:
-                lang = os.environ.get(var)
-                if lang:
-                    return lang.split('.')[0]  # 移除编码部分
-            
-            # 备用方案
-            import locale
-            return locale.getdefaultlocale()[0] or 'en_US'
-            
-        except:
-            return 'en_US'
+        return _get_system_language()
     
     def is_chinese_system(self) -> bool:
         """
@@ -296,42 +374,7 @@ class LinuxAdapter(PlatformAdapter):
         Returns:
             str: 桌面环境名称
         """
-        # 检查常见的桌面环境变量
-        desktop_vars = [
-            'XDG_CURRENT_DESKTOP',
-            'DESKTOP_SESSION',
-            'GDMSESSION'
-        ]
-        
-        for var in desktop_vars:
-            desktop = os.environ.get(var)
-            if desktop:
-                return desktop.lower()
-        
-        # 检查进程
-        try:
-            result = subprocess.run(
-                ['ps', '-e'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                processes = result.stdout.lower()
-                if 'gnome' in processes:
-                    return 'gnome'
-                elif 'kde' in processes or 'plasma' in processes:
-                    return 'kde'
-                elif 'xfce' in processes:
-                    return 'xfce'
-                elif 'lxde' in processes:
-                    return 'lxde'
-                    
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-            pass
-        
-        return 'unknown'
+        return _get_desktop_environment()
     
     def get_system_info(self) -> Dict[str, str]:
         """
@@ -352,14 +395,9 @@ class LinuxAdapter(PlatformAdapter):
             info.update(fontconfig_info)
             
             # 发行版信息
-            try:
-                with open('/etc/os-release', 'r') as f:
-                    for line in f:
-                        if line.startswith('NAME='):
-                            info['distribution'] = line.split('=')[1].strip().strip('"')
-                            break
-            except FileNotFoundError:
-                pass
+            distribution = _load_os_release().get('NAME')
+            if distribution:
+                info['distribution'] = distribution
                 
         except Exception as e:
             self.logger.debug(f"获取Linux系统信息失败: {e}")
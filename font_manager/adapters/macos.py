@@ -12,7 +12,7 @@ from typing import List, Dict, Optional, Set
 from pathlib import Path
 
 from ..core.models import Platform
-from ..utils.helpers import safe_path_join
+from ..utils.helpers import compile_keyword_pattern, iter_files_by_extension, safe_path_join
 from .base import PlatformAdapter
 
 
@@ -23,6 +23,14 @@ class MacOSAdapter(PlatformAdapter):
     处理macOS系统的字体检测、配置和管理。
     """
     
+    # macOS特定的中文字体判断
+    _CHINESE_FONTS = frozenset({
+        'hiragino sans gb', 'pingfang sc', 'pingfang tc', 'pingfang hk',
+        'stheiti', 'stsong', 'stkaiti', 'stfangsong',
+        'apple ligothic', 'ligothic medium', 'ligothic light'
+    })
+    _CHINESE_FONT_PATTERN = compile_keyword_pattern(_CHINESE_FONTS)
+    
     def __init__(self):
         """初始化macOS适配器"""
         super().__init__(Platform.MACOS)
@@ -51,22 +59,14 @@ class MacOSAdapter(PlatformAdapter):
         font_paths = []
         
         for font_dir in self.get_font_directories():
-            if not font_dir.exists():
-                continue
-            
             try:
-                # 递归搜索字体文件
-                for ext in self.get_font_extensions():
-                    pattern = f"**/*{ext}"
-                    font_files = font_dir.glob(pattern)
-                    font_paths.extend([str(f) for f in font_files if f.is_file()])
-                    
+                # 递归搜索字体文件（scandir单次遍历匹配所有扩展名）
+                font_paths.extend(iter_files_by_extension(font_dir, self._ext_tuple))
             except Exception as e:
                 self.logger.warning(f"扫描字体目录失败 {font_dir}: {e}")
         
         # 去重并排序
-        font_paths = list(set(font_paths))
-        font_paths.sort()
+        font_paths = sorted(set(font_paths))
         
         self.logger.info(f"macOS系统找到 {len(font_paths)} 个字体文件")
         return font_paths
@@ -90,15 +90,6 @@ class MacOSAdapter(PlatformAdapter):
             'STFangsong'             # 仿宋
         ]
     
-    def get_font_directories(self) -> List[Path]:
-        """
-        获取macOS字体目录列表
-        
-        Returns:
-            List[Path]: 字体目录路径列表
-        """
-        return [d for d in self._system_font_dirs if d.exists()]
-    
     def get_font_config_paths(self) -> List[Path]:
         """
         获取macOS字体配置文件路径
@@ -188,17 +179,8 @@ class MacOSAdapter(PlatformAdapter):
         Returns:
             bool: 是否为中文字体
         """
-        # macOS特定的中文字体判断
-        macos_chinese_fonts = {
-            'hiragino sans gb', 'pingfang sc', 'pingfang tc', 'pingfang hk',
-            'stheiti', 'stsong', 'stkaiti', 'stfangsong',
-            'apple ligothic', 'ligothic medium', 'ligothic light'
-        }
-        
-        name_lower = font_name.lower()
-        for chinese_font in macos_chinese_fonts:
-            if chinese_font in name_lower:
-                return True
+        if self._CHINESE_FONT_PATTERN.search(font_name.lower()):
+            return True
         
         # 检查文件路径中的特殊标识
         path_lower = str(font_path).lower()
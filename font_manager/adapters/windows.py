@@ -12,6 +12,7 @@ from typing import List, Dict, Optional, Set
 from pathlib import Path
 
 from ..core.models import Platform
+from ..utils.helpers import compile_keyword_pattern, filter_existing_files, iter_files_by_extension
 from .base import PlatformAdapter
 
 
@@ -22,6 +23,14 @@ class WindowsAdapter(PlatformAdapter):
     处理Windows系统的字体检测、配置和管理。
     """
     
+    # Windows特定的中文字体
+    _CHINESE_FONTS = frozenset({
+        'microsoft yahei', 'yahei', 'simhei', 'simsun', 'nsimsun',
+        'fangsong', 'kaiti', 'microsoft jhenghei', 'jhenghei',
+        'mingliu', 'pmingliu', 'dfkai-sb'
+    })
+    _CHINESE_FONT_PATTERN = compile_keyword_pattern(_CHINESE_FONTS)
+    
     def __init__(self):
         """初始化Windows适配器"""
         super().__init__(Platform.WINDOWS)
@@ -43,36 +52,33 @@ class WindowsAdapter(PlatformAdapter):
         Returns:
             List[str]: 系统字体文件路径列表
         """
-        font_paths = []
+        # 按normcase路径去重（Windows路径不区分大小写）
+        seen = {}
         
         # 从文件系统扫描
         for font_dir in self.get_font_directories():
-            if not font_dir.exists():
-                continue
-            
             try:
-                for ext in self.get_font_extensions():
-                    pattern = f"*{ext}"
-                    font_files = font_dir.glob(pattern)
-                    font_paths.extend([str(f) for f in font_files if f.is_file()])
-                    
+                for font_path in iter_files_by_extension(font_dir, self._ext_tuple, recursive=False):
+                    seen.setdefault(os.path.normcase(font_path), font_path)
             except Exception as e:
                 self.logger.warning(f"扫描字体目录失败 {font_dir}: {e}")
         
-        # 从注册表获取字体信息
-        registry_fonts = self._get_fonts_from_registry()
-        font_paths.extend(registry_fonts)
+        # 从注册表获取字体信息，扫描中已找到的文件无需再次检查是否存在
+        registry_only = [
+            font_path for font_path in self._read_registry_font_paths()
+            if os.path.normcase(font_path) not in seen
+        ]
+        for font_path in filter_existing_files(registry_only):
+            seen.setdefault(os.path.normcase(font_path), font_path)
         
-        # 去重并排序
-        font_paths = list(set(font_paths))
-        font_paths.sort()
+        font_paths = sorted(seen.values())
         
         self.logger.info(f"Windows系统找到 {len(font_paths)} 个字体文件")
         return font_paths
     
-    def _get_fonts_from_registry(self) -> List[str]:
+    def _read_registry_font_paths(self) -> List[str]:
         """
-        从Windows注册表获取字体信息
+        读取注册表中登记的字体文件路径（不检查文件是否存在）
         
         Returns:
             List[str]: 注册表中的字体路径列表
@@ -81,23 +87,18 @@ class WindowsAdapter(PlatformAdapter):
         
         try:
             with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, self._font_registry_key) as key:
-                i = 0
-                while True:
-                    try:
-                        font_name, font_file, _ = winreg.EnumValue(key, i)
-                        
-                        # 构建完整路径
-                        if not os.path.isabs(font_file):
-                            windows_dir = os.environ.get('WINDIR', 'C:\\Windows')
-                            font_file = os.path.join(windows_dir, 'Fonts', font_file)
-                        
-                        if os.path.exists(font_file):
-                            font_paths.append(font_file)
-                        
-                        i += 1
-                        
-                    except WindowsError:
-                        break
+                # 一次性获取值数量，避免以WindowsError作为循环终止条件
+                _, value_count, _ = winreg.QueryInfoKey(key)
+                windows_fonts_dir = os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')
+                
+                for i in range(value_count):
+                    font_name, font_file, _ = winreg.EnumValue(key, i)
+                    
+                    # 构建完整路径
+                    if not os.path.isabs(font_file):
+                        font_file = os.path.join(windows_fonts_dir, font_file)
+                    
+                    font_paths.append(font_file)
                         
         except Exception as e:
             self.logger.warning(f"读取字体注册表失败: {e}")
@@ -124,15 +125,6 @@ class WindowsAdapter(PlatformAdapter):
             'Arial Unicode MS'       # Unicode字体
         ]
     
-    def get_font_directories(self) -> List[Path]:
-        """
-        获取Windows字体目录列表
-        
-        Returns:
-            List[Path]: 字体目录路径列表
-        """
-        return [d for d in self._system_font_dirs if d.exists()]
-    
     def get_font_config_paths(self) -> List[Path]:
         """
         获取Windows字体配置文件路径
@@ -167,19 +159,7 @@ class WindowsAdapter(PlatformAdapter):
         Returns:
             bool: 是否为中文字体
         """
-        # Windows特定的中文字体
-        windows_chinese_fonts = {
-            'microsoft yahei', 'yahei', 'simhei', 'simsun', 'nsimsun',
-            'fangsong', 'kaiti', 'microsoft jhenghei', 'jhenghei',
-            'mingliu', 'pmingliu', 'dfkai-sb'
-        }
-        
-        name_lower = font_name.lower()
-        for chinese_font in windows_chinese_fonts:
-            if chinese_font in name_lower:
-                return True
-        
-        return False
+        return self._CHINESE_FONT_PATTERN.search(font_name.lower()) is not None
     
     def get_system_language(self) -> str:
         """
@@ -188,10 +168,21 @@ class WindowsAdapter(PlatformAdapter):
         Returns:
             str: 系统语言代码
         """
+        import locale
+        
+        # 直接查询用户默认LCID（getdefaultlocale已在Python 3.11中弃用）
+        try:
+            import ctypes
+            lcid = ctypes.windll.kernel32.GetUserDefaultLCID()
+            lang = locale.windows_locale.get(lcid)
+            if lang:
+                return lang
+        except (AttributeError, OSError):
+            pass
+        
         try:
-            import locale
-            return locale.getdefaultlocale()[0] or 'en_US'
-        except:
+            return locale.getlocale(locale.LC_CTYPE)[0] or 'en_US'
+        except (ValueError, locale.Error):
             return 'en_US'
     
     def is_chinese_system(self) -> bool:
@@ -6,7 +6,6 @@ Font Manager Core Module
 核心模块包含字体管理的主要功能组件。
 """
 
-from .manager import FontManager
 from .models import FontInfo, FontSetupResult, ValidationReport
 from .exceptions import (
     FontManagerError,
@@ -24,4 +23,13 @@ __all__ = [
     "FontNotFoundError",
     "FontConfigError",
     "PlatformNotSupportedError"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """首次访问FontManager时再导入manager模块 (PEP 562)"""
+    if name == "FontManager":
+        from .manager import FontManager
+        globals()[name] = FontManager
+        return FontManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Font List Cache
+
+字体列表磁盘缓存，按字体目录的修改时间判断缓存是否失效。
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import FontInfo, Platform
+from ..utils.logger import LoggerMixin
+from ..utils.helpers import get_platform, ensure_directory
+
+
+CACHE_VERSION = 2
+
+
+class FontListCache(LoggerMixin):
+    """
+    字体列表磁盘缓存
+    
+    记录每个字体目录（含子目录）的修改时间，目录未变化时
+    直接读取上次的检测结果，跳过整个目录扫描。目录变化时，
+    按 (路径, st_mtime_ns, st_size) 复用未变化文件的字体信息。
+    """
+    
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        初始化字体列表缓存
+        
+        Args:
+            cache_path: 缓存文件路径，None表示使用默认路径
+        """
+        self.platform = get_platform()
+        self.cache_path = cache_path or self._get_default_cache_path()
+    
+    def _get_default_cache_path(self) -> Path:
+        """
+        获取默认缓存文件路径
+        
+        Returns:
+            Path: 默认缓存文件路径
+        """
+        if self.platform == Platform.MACOS:
+            cache_dir = Path.home() / "Library/Caches/FontManager"
+        elif self.platform == Platform.WINDOWS:
+            cache_dir = Path.home() / "AppData/Local/FontManager/Cache"
+        else:  # Linux
+            xdg_cache = os.environ.get('XDG_CACHE_HOME')
+            cache_dir = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+            cache_dir = cache_dir / "fontmanager"
+        
+        return cache_dir / f"fonts-v{CACHE_VERSION}.json"
+    
+    @staticmethod
+    def _collect_dir_mtimes(directories: List[Path]) -> List[Tuple[str, int]]:
+        """
+        收集字体目录及其所有子目录的修改时间
+        
+        Args:
+            directories: 字体目录列表
+            
+        Returns:
+            List[Tuple[str, int]]: (目录路径, st_mtime_ns) 列表
+        """
+        dir_mtimes = []
+        for directory in directories:
+            # 与iter_font_entries一致：跳过隐藏目录，不跟随符号链接目录（walk默认不跟随）
+            if hasattr(os, 'fwalk'):
+                # fwalk提供已打开的目录fd，fstat无需再次解析路径（Linux/macOS）
+                try:
+                    for root, dirs, _, root_fd in os.fwalk(str(directory)):
+                        dirs[:] = [d for d in dirs if not d.startswith('.')]
+                        dir_mtimes.append((root, os.fstat(root_fd).st_mtime_ns))
+                except OSError:
+                    continue
+            else:
+                for root, dirs, _ in os.walk(str(directory)):
+                    dirs[:] = [d for d in dirs if not d.startswith('.')]
+                    try:
+                        dir_mtimes.append((root, os.stat(root).st_mtime_ns))
+                    except OSError:
+                        continue
+        return dir_mtimes
+    
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """
+        读取缓存文件并检查版本和平台
+        
+        Returns:
+            Optional[Dict[str, Any]]: 缓存数据，无效时返回None
+        """
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if data.get('version') != CACHE_VERSION or data.get('platform') != self.platform.value:
+            return None
+        
+        return data
+    
+    def load(self, directories: List[Path]) -> Optional[List[FontInfo]]:
+        """
+        读取缓存的字体列表
+        
+        Args:
+            directories: 当前的字体目录列表
+            
+        Returns:
+            Optional[List[FontInfo]]: 缓存有效时返回字体列表，否则返回None
+        """
+        data = self._read()
+        if data is None:
+            return None
+        
+        # 顶层目录集合变化时缓存失效
+        if data.get('roots') != [str(d) for d in directories]:
+            return None
+        
+        # 任一目录修改时间变化时缓存失效
+        for dir_path, mtime_ns in data.get('dirs', []):
+            try:
+                if os.stat(dir_path).st_mtime_ns != mtime_ns:
+                    return None
+            except OSError:
+                return None
+        
+        try:
+            fonts = [FontInfo.from_dict(item) for item in data.get('fonts', [])]
+        except (KeyError, ValueError, TypeError) as e:
+            self.logger.debug(f"字体缓存内容无效: {e}")
+            return None
+        
+        self.logger.info(f"从磁盘缓存加载 {len(fonts)} 个字体: {self.cache_path}")
+        return fonts
+    
+    def load_file_index(self) -> Dict[str, Tuple[int, int, FontInfo]]:
+        """
+        读取按文件索引的字体信息，供目录变化后的增量扫描复用
+        
+        Returns:
+            Dict[str, Tuple[int, int, FontInfo]]: 路径 -> (st_mtime_ns, st_size, 字体信息)
+        """
+        data = self._read()
+        if data is None:
+            return {}
+        
+        files = data.get('files', {})
+        index = {}
+        for item in data.get('fonts', []):
+            stat_info = files.get(item.get('path'))
+            if not stat_info:
+                continue
+            try:
+                index[item['path']] = (stat_info[0], stat_info[1], FontInfo.from_dict(item))
+            except (KeyError, ValueError, TypeError, IndexError):
+                continue
+        
+        return index
+    
+    def save(
+        self,
+        directories: List[Path],
+        fonts: List[FontInfo],
+        file_stats: Optional[Dict[str, Tuple[int, int]]] = None
+    ) -> bool:
+        """
+        保存字体列表到缓存
+        
+        Args:
+            directories: 字体目录列表
+            fonts: 字体列表
+            file_stats: 字体文件路径 -> (st_mtime_ns, st_size)，用于增量复用
+            
+        Returns:
+            bool: 是否保存成功
+        """
+        data = {
+            'version': CACHE_VERSION,
+            'platform': self.platform.value,
+            'roots': [str(d) for d in directories],
+            'dirs': self._collect_dir_mtimes(directories),
+            'files': file_stats or {},
+            'fonts': [font.to_dict() for font in fonts]
+        }
+        
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            ensure_directory(self.cache_path.parent)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            return True
+        except OSError as e:
+            self.logger.warning(f"保存字体缓存失败: {e}")
+            return False
+    
+    def clear(self):
+        """删除缓存文件"""
+        try:
+            self.cache_path.unlink()
+        except OSError:
+            pass
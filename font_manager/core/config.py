@@ -6,11 +6,13 @@ Configuration Manager
 配置管理器，负责字体配置的读取、保存和验证。
 """
 
+import atexit
 import json
+import threading
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Set, Tuple, Union
 from dataclasses import asdict
 import time
 
@@ -19,6 +21,24 @@ from .exceptions import FontConfigError
 from ..utils.logger import LoggerMixin
 from ..utils.helpers import get_platform, ensure_directory
 
+# 优先使用libyaml的C实现，未编译libyaml时退回纯Python实现
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+
+# 有未保存修改的配置管理器（强引用，保证实例被丢弃后修改仍会写入）
+_dirty_configs: Set["ConfigManager"] = set()
+
+
+@atexit.register
+def _flush_dirty_configs():
+    """进程退出时保存所有未写入的配置修改"""
+    # 退出阶段日志输出流可能已关闭，写入时不记录日志
+    for config_manager in list(_dirty_configs):
+        config_manager.flush(quiet=True)
+
 
 class ConfigManager(LoggerMixin):
     """
@@ -28,6 +48,11 @@ class ConfigManager(LoggerMixin):
     支持JSON和YAML格式。
     """
     
+    # 标记修改后延迟写入的时间（秒），期间的多次修改合并为一次写入
+    _SAVE_DELAY = 0.1
+    # 写入失败后重试间隔的上限（秒），连续失败时间隔逐次翻倍
+    _MAX_RETRY_DELAY = 30.0
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         初始化配置管理器
@@ -43,10 +68,23 @@ class ConfigManager(LoggerMixin):
         else:
             self.config_path = self._get_default_config_path()
         
+        # YAML配置旁保存一份JSON副本，JSON解析远快于YAML
+        self._is_yaml = self.config_path.suffix.lower() in ('.yaml', '.yml')
+        self._sidecar_path = (
+            self.config_path.with_name(self.config_path.name + '.json') if self._is_yaml else None
+        )
+        
         # 配置数据
         self._config: Dict[str, Any] = {}
         self._config_loaded = False
         self._last_modified = 0.0
+        self._file_signature: Optional[Tuple[int, int]] = None  # (st_mtime_ns, st_size)
+        
+        # 延迟写入状态（定时器线程与调用方共用同一把锁）
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._failed_saves = 0
+        self._lock = threading.RLock()
         
         # 默认配置
         self._default_config = self._get_default_config()
@@ -164,6 +202,19 @@ class ConfigManager(LoggerMixin):
             "updated_at": time.time()
         }
     
+    def _stat_signature(self) -> Optional[Tuple[int, int]]:
+        """
+        获取配置文件签名，用于判断文件是否变化
+        
+        Returns:
+            Optional[Tuple[int, int]]: (st_mtime_ns, st_size)，文件不存在返回None
+        """
+        try:
+            stat_result = self.config_path.stat()
+        except OSError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+    
     def load_config(self, force_reload: bool = False) -> Dict[str, Any]:
         """
         加载配置文件
@@ -177,24 +228,23 @@ class ConfigManager(LoggerMixin):
         Raises:
             FontConfigError: 配置加载失败
         """
-        # 检查是否需要重新加载
+        # 文件签名未变化时直接返回已解析的配置（一次stat，无需重新解析）
+        signature = self._stat_signature()
         if not force_reload and self._config_loaded:
-            if self.config_path.exists():
-                current_modified = self.config_path.stat().st_mtime
-                if current_modified <= self._last_modified:
-                    return self._config
+            if signature is not None and signature == self._file_signature:
+                return self._config
         
         try:
-            if not self.config_path.exists():
+            if signature is None:
                 self.logger.info("配置文件不存在，使用默认配置")
                 self._config = self._default_config.copy()
                 self.save_config()  # 保存默认配置
             else:
                 # 读取配置文件
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    if self.config_path.suffix.lower() == '.yaml' or self.config_path.suffix.lower() == '.yml':
-                        self._config = yaml.safe_load(f) or {}
-                    else:
+                if self._is_yaml:
+                    self._config = self._load_yaml_config(signature)
+                else:
+                    with open(self.config_path, 'r', encoding='utf-8') as f:
                         self._config = json.load(f)
                 
                 # 验证配置
@@ -204,7 +254,8 @@ class ConfigManager(LoggerMixin):
                 self._config = self._merge_config(self._default_config, self._config)
                 
                 # 更新时间戳
-                self._last_modified = self.config_path.stat().st_mtime
+                self._file_signature = signature
+                self._last_modified = signature[0] / 1e9
                 
                 self.logger.info(f"配置文件加载成功: {self.config_path}")
             
@@ -220,6 +271,123 @@ class ConfigManager(LoggerMixin):
             self.logger.error(error_msg)
             raise FontConfigError(str(self.config_path), error_msg)
     
+    def _load_yaml_config(self, yaml_signature: Tuple[int, int]) -> Dict[str, Any]:
+        """
+        读取YAML配置，JSON副本记录的YAML签名与当前文件一致时直接读取副本
+        
+        Args:
+            yaml_signature: YAML文件的 (st_mtime_ns, st_size)
+            
+        Returns:
+            Dict[str, Any]: 配置字典
+        """
+        try:
+            with open(self._sidecar_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+            # 比较签名而非修改时间先后，时间戳粒度较粗时同一时刻内的手动修改也能识别
+            if sidecar.get('yaml_signature') == list(yaml_signature):
+                return sidecar['config']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=YamlLoader) or {}
+        
+        self._write_json_sidecar(config, yaml_signature)
+        return config
+    
+    def _write_json_sidecar(self, config: Dict[str, Any], yaml_signature: Optional[Tuple[int, int]]):
+        """
+        写入YAML配置的JSON副本（失败时删除副本，下次回退到YAML）
+        
+        Args:
+            config: 配置字典
+            yaml_signature: 副本对应的YAML文件 (st_mtime_ns, st_size)，None表示不写入副本
+        """
+        try:
+            if yaml_signature is None:
+                raise OSError("YAML配置文件不存在")
+            self._write_atomic(
+                self._sidecar_path,
+                lambda f: json.dump({'yaml_signature': list(yaml_signature), 'config': config},
+                                    f, ensure_ascii=False)
+            )
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"写入配置JSON副本失败: {e}")
+            try:
+                self._sidecar_path.unlink()
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _write_atomic(path: Path, dump):
+        """
+        先写临时文件再替换，避免写入中断导致文件损坏
+        
+        Args:
+            path: 目标文件路径
+            dump: 接收文件对象并写入内容的函数
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                dump(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+    
+    def mark_dirty(self):
+        """
+        标记配置已修改，短暂延迟后在后台写入文件
+        
+        延迟期间的多次修改合并为一次写入，进程退出前未写入的修改会在退出时保存。
+        """
+        with self._lock:
+            self._dirty = True
+            _dirty_configs.add(self)
+            if self._save_timer is None:
+                self._schedule_save(self._SAVE_DELAY)
+    
+    def _schedule_save(self, delay: float):
+        """
+        在后台定时器中延迟写入，替换等待中的定时器（调用方需持有锁）
+        
+        Args:
+            delay: 延迟时间（秒）
+        """
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(delay, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    def flush(self, quiet: bool = False) -> bool:
+        """
+        立即写入未保存的配置修改
+        
+        Args:
+            quiet: 是否不记录日志（进程退出时日志输出流可能已关闭）
+            
+        Returns:
+            bool: 是否保存成功（无修改时返回True）
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            try:
+                self._write_config(quiet=quiet)
+            except FontConfigError:
+                # 保留修改标记并重新安排写入，避免之后的mark_dirty因残留的定时器不再调度
+                self._failed_saves += 1
+                self._schedule_save(min(self._SAVE_DELAY * 2 ** self._failed_saves, self._MAX_RETRY_DELAY))
+                return False
+            self._clear_pending_save()
+            return True
+    
     def save_config(self, config: Optional[Dict[str, Any]] = None) -> bool:
         """
         保存配置文件
@@ -230,6 +398,34 @@ class ConfigManager(LoggerMixin):
         Returns:
             bool: 是否保存成功
             
+        Raises:
+            FontConfigError: 配置保存失败
+        """
+        with self._lock:
+            saved = self._write_config(config)
+            self._clear_pending_save()
+            return saved
+    
+    def _clear_pending_save(self):
+        """已写入全部修改，清除修改标记并取消等待中的延迟写入"""
+        self._dirty = False
+        self._failed_saves = 0
+        _dirty_configs.discard(self)
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+    
+    def _write_config(self, config: Optional[Dict[str, Any]] = None, quiet: bool = False) -> bool:
+        """
+        写入配置文件
+        
+        Args:
+            config: 要保存的配置，None表示保存当前配置
+            quiet: 是否不记录日志
+            
+        Returns:
+            bool: 是否保存成功
+            
         Raises:
             FontConfigError: 配置保存失败
         """
@@ -244,22 +440,35 @@ class ConfigManager(LoggerMixin):
             config["updated_at"] = time.time()
             
             # 保存配置文件
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                if self.config_path.suffix.lower() == '.yaml' or self.config_path.suffix.lower() == '.yml':
-                    yaml.dump(config, f, default_flow_style=False, allow_unicode=True, indent=2)
-                else:
-                    json.dump(config, f, indent=2, ensure_ascii=False)
+            if self._is_yaml:
+                self._write_atomic(
+                    self.config_path,
+                    lambda f: yaml.dump(config, f, Dumper=YamlDumper, default_flow_style=False,
+                                        allow_unicode=True, indent=2)
+                )
+            else:
+                self._write_atomic(
+                    self.config_path,
+                    lambda f: json.dump(config, f, indent=2, ensure_ascii=False)
+                )
             
             # 更新内部状态
             self._config = config
-            self._last_modified = self.config_path.stat().st_mtime
-            
-            self.logger.info(f"配置文件保存成功: {self.config_path}")
+            self._file_signature = self._stat_signature()
+            if self._is_yaml:
+                # JSON副本记录刚写入的YAML签名，签名不一致时回退到YAML
+                self._write_json_sidecar(config, self._file_signature)
+            if self._file_signature is not None:
+                self._last_modified = self._file_signature[0] / 1e9
+            
+            if not quiet:
+                self.logger.info(f"配置文件保存成功: {self.config_path}")
             return True
             
         except Exception as e:
             error_msg = f"保存配置文件失败: {e}"
-            self.logger.error(error_msg)
+            if not quiet:
+                self.logger.error(error_msg)
             raise FontConfigError(str(self.config_path), error_msg)
     
     def _validate_config(self, config: Dict[str, Any]) -> bool:
@@ -363,16 +572,18 @@ class ConfigManager(LoggerMixin):
             self.load_config()
         
         keys = key.split('.')
-        config = self._config
         
-        # 导航到目标位置
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        
-        # 设置值
-        config[keys[-1]] = value
+        with self._lock:
+            config = self._config
+            
+            # 导航到目标位置
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            
+            # 设置值
+            config[keys[-1]] = value
         
         self.logger.debug(f"配置已更新: {key} = {value}")
         return True
@@ -7,18 +7,21 @@ Font Detector
 """
 
 import os
+import stat
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Iterator, List, Dict, Set, Optional, Tuple
 import re
 
 from .models import FontInfo, FontWeight, FontStyle, Platform
 from .exceptions import FontNotFoundError, FontValidationError
+from .cache import FontListCache
 from ..utils.logger import LoggerMixin
 from ..utils.helpers import (
-    get_platform, is_font_file, get_file_size, 
+    get_platform, has_font_extension,
     calculate_font_score, get_system_font_directories,
-    normalize_font_name, find_files_by_pattern
+    normalize_font_name, iter_font_entries
 )
 from ..adapters import get_platform_adapter
 
@@ -30,6 +33,30 @@ class FontDetector(LoggerMixin):
     负责扫描系统字体文件，提取字体信息，并进行质量评估。
     """
     
+    # 字体文件数达到该值时并行提取字体信息
+    _PARALLEL_EXTRACT_THRESHOLD = 64
+    
+    # 文件名中需要移除的样式后缀
+    _SUFFIX_PATTERN = re.compile(
+        r'[-_ ]*(?:Regular|Bold|Italic|Light|Medium|Heavy|Thin|Black|Condensed|Extended|Narrow)$'
+    )
+    
+    # 字体粗细关键词，每个分组对应_WEIGHT_VALUES中的一项；
+    # 组合词 (extralight/semibold等) 起始位置更靠前，会先于light/bold匹配
+    _WEIGHT_PATTERN = re.compile(
+        r'(thin|ultralight)|(extralight)|(semibold|demibold)|(extrabold|ultrabold)'
+        r'|(black|heavy)|(light)|(medium)|(bold)',
+        re.IGNORECASE
+    )
+    _WEIGHT_VALUES = (
+        FontWeight.THIN, FontWeight.EXTRA_LIGHT, FontWeight.SEMI_BOLD, FontWeight.EXTRA_BOLD,
+        FontWeight.BLACK, FontWeight.LIGHT, FontWeight.MEDIUM, FontWeight.BOLD
+    )
+    
+    # 字体样式关键词
+    _STYLE_PATTERN = re.compile(r'(italic)|(oblique)', re.IGNORECASE)
+    _STYLE_VALUES = (FontStyle.ITALIC, FontStyle.OBLIQUE)
+    
     def __init__(self, cache_enabled: bool = True):
         """
         初始化字体检测器
@@ -40,15 +67,21 @@ class FontDetector(LoggerMixin):
         self.platform = get_platform()
         self.cache_enabled = cache_enabled
         self._font_cache: Dict[str, FontInfo] = {}
-        self._scan_cache: Dict[str, List[Path]] = {}
+        self._normalized_index: Dict[str, FontInfo] = {}  # 标准化小写名称 -> 字体
+        self._by_name: Dict[str, FontInfo] = {}  # 字体名称 -> 最近一次检测到的首个同名字体
+        self._scan_cache: Dict[Tuple[Path, ...], List[os.DirEntry]] = {}
+        self._ranked_chinese: Optional[List[FontInfo]] = None  # 排序后的中文字体，字体列表变化时失效
         self._last_scan_time: float = 0
+        self._disk_cache = FontListCache() if cache_enabled else None
         
         # 获取平台适配器
         self.adapter = get_platform_adapter(self.platform)
         
         # 从适配器获取配置
         self.font_extensions = self.adapter.get_font_extensions()
+        self._ext_tuple = tuple(ext.lower() for ext in self.font_extensions)
         self.chinese_font_keywords = self.adapter.get_chinese_font_keywords()
+        self._preferred_fonts = self.adapter.get_preferred_fonts()
         
         self.logger.info(f"FontDetector initialized for platform: {self.platform.value}")
     
@@ -65,42 +98,190 @@ class FontDetector(LoggerMixin):
         start_time = time.time()
         self.logger.info("开始检测系统字体...")
         
-        # 检查缓存
-        if not force_rescan and self.cache_enabled and self._font_cache:
-            cache_age = time.time() - self._last_scan_time
-            if cache_age < 3600:  # 缓存1小时
-                self.logger.info(f"使用缓存的字体信息 ({len(self._font_cache)} 个字体)")
-                return list(self._font_cache.values())
-        
-        # 获取系统字体目录
+        # 获取系统字体目录（强制重扫时重新检查目录是否存在）
+        if force_rescan:
+            self.adapter.refresh_dirs()
         font_directories = self.adapter.get_font_directories()
+        
+        # 检查内存缓存和磁盘缓存
+        cached_fonts = self._load_cached_fonts(font_directories, force_rescan)
+        if cached_fonts is not None:
+            return cached_fonts
+        
         self.logger.info(f"扫描 {len(font_directories)} 个字体目录")
         
         # 扫描字体文件
         font_files = self._scan_font_files(font_directories, force_rescan)
         self.logger.info(f"找到 {len(font_files)} 个字体文件")
         
-        # 提取字体信息
+        # 上次扫描的逐文件缓存：未修改的文件直接复用字体信息
+        reusable = {}
+        if not force_rescan and self._disk_cache is not None:
+            reusable = self._disk_cache.load_file_index()
+        
+        def extract(font_entry: os.DirEntry) -> Optional[FontInfo]:
+            return self._safe_extract_font_info(font_entry, reusable)
+        
+        # 提取字体信息（文件较多时用线程池重叠stat等阻塞IO）
+        if len(font_files) >= self._PARALLEL_EXTRACT_THRESHOLD:
+            max_workers = min(32, (os.cpu_count() or 4) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(extract, font_files))
+        else:
+            results = [extract(font_entry) for font_entry in font_files]
+        
+        # 单线程写入缓存，避免加锁
+        fonts = [font_info for font_info in results if font_info]
+        self._store_scan_results(font_directories, fonts, font_files)
+        
+        scan_time = time.time() - start_time
+        self.logger.info(f"字体检测完成，找到 {len(fonts)} 个字体，耗时 {scan_time:.2f}秒")
+        
+        return fonts
+    
+    def iter_system_fonts(self, force_rescan: bool = False) -> Iterator[FontInfo]:
+        """
+        逐个生成系统字体（边遍历目录边提取信息）
+        
+        调用方提前停止迭代时，剩余的目录不会被扫描。
+        完整迭代后结果写入缓存，与detect_system_fonts共享。
+        
+        Args:
+            force_rescan: 是否强制重新扫描
+            
+        Yields:
+            FontInfo: 检测到的字体
+        """
+        if force_rescan:
+            self.adapter.refresh_dirs()
+        font_directories = self.adapter.get_font_directories()
+        
+        cached_fonts = self._load_cached_fonts(font_directories, force_rescan)
+        if cached_fonts is not None:
+            yield from cached_fonts
+            return
+        
+        reusable = {}
+        if not force_rescan and self._disk_cache is not None:
+            reusable = self._disk_cache.load_file_index()
+        
+        font_entries = {}
         fonts = []
-        for font_file in font_files:
-            try:
-                font_info = self._extract_font_info(font_file)
+        for directory in font_directories:
+            for entry in iter_font_entries(directory, self._ext_tuple):
+                if entry.path in font_entries:
+                    continue
+                font_entries[entry.path] = entry
+                
+                font_info = self._safe_extract_font_info(entry, reusable)
                 if font_info:
                     fonts.append(font_info)
-                    if self.cache_enabled:
-                        self._font_cache[font_info.name] = font_info
-            except Exception as e:
-                self.logger.warning(f"提取字体信息失败 {font_file}: {e}")
+                    yield font_info
+        
+        font_files = list(font_entries.values())
+        if self.cache_enabled:
+            self._scan_cache[tuple(font_directories)] = font_files
+        self._store_scan_results(font_directories, fonts, font_files)
+    
+    def _is_memory_cache_valid(self) -> bool:
+        """
+        内存缓存是否可用（缓存1小时）
+        
+        Returns:
+            bool: 内存缓存是否有效
+        """
+        if not self.cache_enabled or not self._font_cache:
+            return False
+        return time.time() - self._last_scan_time < 3600
+    
+    def _load_cached_fonts(self, font_directories: List[Path], force_rescan: bool) -> Optional[List[FontInfo]]:
+        """
+        从内存缓存或磁盘缓存读取字体列表
+        
+        Args:
+            font_directories: 字体目录列表
+            force_rescan: 是否强制重新扫描
+            
+        Returns:
+            Optional[List[FontInfo]]: 缓存的字体列表，需要重新扫描时返回None
+        """
+        if force_rescan:
+            return None
+        
+        # 检查内存缓存
+        if self._is_memory_cache_valid():
+            self.logger.info(f"使用缓存的字体信息 ({len(self._font_cache)} 个字体)")
+            return list(self._font_cache.values())
+        
+        # 检查磁盘缓存（目录未变化时跳过扫描）
+        if self._disk_cache is not None:
+            cached_fonts = self._disk_cache.load(font_directories)
+            if cached_fonts is not None:
+                self._ranked_chinese = None
+                self._font_cache = {font.name: font for font in cached_fonts}
+                self._normalized_index = {}
+                for font in cached_fonts:
+                    self._normalized_index.setdefault(font.normalized_name, font)
+                self._index_by_name(cached_fonts)
+                self._last_scan_time = time.time()
+                return cached_fonts
+        
+        return None
+    
+    def _store_scan_results(
+        self,
+        font_directories: List[Path],
+        fonts: List[FontInfo],
+        font_files: List[os.DirEntry]
+    ):
+        """
+        将扫描结果写入内存缓存和磁盘缓存
+        
+        Args:
+            font_directories: 字体目录列表
+            fonts: 检测到的字体列表
+            font_files: 扫描到的字体文件目录项
+        """
+        self._ranked_chinese = None
+        self._index_by_name(fonts)
+        if self.cache_enabled:
+            # 重新扫描后按本次结果重建索引，避免保留上次扫描的旧字体对象
+            self._normalized_index = {}
+            for font_info in fonts:
+                self._font_cache[font_info.name] = font_info
+                self._normalized_index.setdefault(font_info.normalized_name, font_info)
         
         # 更新缓存时间
         self._last_scan_time = time.time()
         
-        scan_time = time.time() - start_time
-        self.logger.info(f"字体检测完成，找到 {len(fonts)} 个字体，耗时 {scan_time:.2f}秒")
+        if self._disk_cache is not None:
+            self._disk_cache.save(font_directories, fonts, self._collect_file_stats(font_files))
+    
+    def _index_by_name(self, fonts: List[FontInfo]):
+        """
+        按名称建立字体索引，同名字体保留列表中的第一个
         
-        return fonts
+        Args:
+            fonts: 检测到的字体列表
+        """
+        by_name: Dict[str, FontInfo] = {}
+        for font in fonts:
+            by_name.setdefault(font.name, font)
+        self._by_name = by_name
+    
+    def get_by_name(self, name: str) -> Optional[FontInfo]:
+        """
+        按精确名称获取最近一次检测到的字体
+        
+        Args:
+            name: 字体名称
+            
+        Returns:
+            Optional[FontInfo]: 找到的字体，未找到或尚未检测时返回None
+        """
+        return self._by_name.get(name)
     
-    def _scan_font_files(self, directories: List[Path], force_rescan: bool = False) -> List[Path]:
+    def _scan_font_files(self, directories: List[Path], force_rescan: bool = False) -> List[os.DirEntry]:
         """
         扫描字体文件
         
@@ -109,15 +290,16 @@ class FontDetector(LoggerMixin):
             force_rescan: 是否强制重新扫描
             
         Returns:
-            List[Path]: 字体文件路径列表
+            List[os.DirEntry]: 字体文件目录项列表（按目录顺序，目录内按名称排序）
         """
-        cache_key = "|".join(str(d) for d in directories)
+        # Path可哈希，直接以元组为键，无需拼接字符串
+        cache_key = tuple(directories)
         
         # 检查扫描缓存
         if not force_rescan and self.cache_enabled and cache_key in self._scan_cache:
             return self._scan_cache[cache_key]
         
-        font_files = []
+        font_entries = {}
         
         for directory in directories:
             if not directory.exists():
@@ -125,20 +307,18 @@ class FontDetector(LoggerMixin):
                 continue
             
             try:
-                # 扫描字体文件
-                for ext in self.font_extensions:
-                    pattern = f"*{ext}"
-                    files = find_files_by_pattern(directory, pattern, recursive=True)
-                    font_files.extend(files)
+                # 单次遍历目录树，按扩展名过滤，保留DirEntry以复用其stat缓存
+                files = list(iter_font_entries(directory, self._ext_tuple))
+                for entry in files:
+                    font_entries.setdefault(entry.path, entry)
                     
-                self.logger.debug(f"扫描目录 {directory}: 找到 {len([f for f in font_files if str(f).startswith(str(directory))])} 个文件")
+                self.logger.debug(f"扫描目录 {directory}: 找到 {len(files)} 个文件")
                 
             except Exception as e:
                 self.logger.error(f"扫描目录失败 {directory}: {e}")
         
-        # 去重并排序
-        font_files = list(set(font_files))
-        font_files.sort()
+        # 按路径去重，保持遍历顺序（目录未变化时顺序稳定），无需排序
+        font_files = list(font_entries.values())
         
         # 缓存结果
         if self.cache_enabled:
@@ -146,19 +326,68 @@ class FontDetector(LoggerMixin):
         
         return font_files
     
-    def _extract_font_info(self, font_path: Path) -> Optional[FontInfo]:
+    def _safe_extract_font_info(
+        self,
+        entry: os.DirEntry,
+        reusable: Optional[Dict[str, Tuple[int, int, FontInfo]]] = None
+    ) -> Optional[FontInfo]:
+        """
+        提取字体信息，异常时记录警告并返回None（供线程池调用）
+        
+        Args:
+            entry: 字体文件目录项
+            reusable: 上次扫描的逐文件缓存，路径 -> (st_mtime_ns, st_size, 字体信息)
+            
+        Returns:
+            Optional[FontInfo]: 字体信息，提取失败返回None
+        """
+        try:
+            cached = reusable.get(entry.path) if reusable else None
+            if cached is not None:
+                entry_stat = entry.stat()
+                if (entry_stat.st_mtime_ns, entry_stat.st_size) == cached[:2]:
+                    return cached[2]
+            
+            return self._extract_font_info(entry)
+        except Exception as e:
+            self.logger.warning(f"提取字体信息失败 {entry.path}: {e}")
+            return None
+    
+    @staticmethod
+    def _collect_file_stats(entries: List[os.DirEntry]) -> Dict[str, Tuple[int, int]]:
+        """
+        收集字体文件的修改时间和大小（DirEntry已缓存stat结果）
+        
+        Args:
+            entries: 字体文件目录项列表
+            
+        Returns:
+            Dict[str, Tuple[int, int]]: 路径 -> (st_mtime_ns, st_size)
+        """
+        file_stats = {}
+        for entry in entries:
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                continue
+            file_stats[entry.path] = (entry_stat.st_mtime_ns, entry_stat.st_size)
+        return file_stats
+    
+    def _extract_font_info(self, entry: os.DirEntry) -> Optional[FontInfo]:
         """
         提取字体信息
         
         Args:
-            font_path: 字体文件路径
+            entry: 字体文件目录项（由_scan_font_files返回）
             
         Returns:
             Optional[FontInfo]: 字体信息，提取失败返回None
         """
+        font_path = Path(entry.path)
+        
         try:
-            # 基本信息
-            file_size = get_file_size(font_path)
+            # 基本信息（DirEntry.stat()结果已缓存，无需再次stat）
+            file_size = entry.stat().st_size
             if file_size == 0:
                 return None
             
@@ -169,13 +398,12 @@ class FontDetector(LoggerMixin):
             font_style = self._extract_font_style(font_name)
             
             # 检测中文支持
-            supports_chinese = self.adapter.is_chinese_font(font_name, font_path)
+            supports_chinese = self.adapter.is_chinese_font(font_name, font_path, file_size)
             
             # 计算质量评分
-            preferred_fonts = self.adapter.get_preferred_fonts()
             quality_score = calculate_font_score(
                 font_name, supports_chinese, file_size, 
-                self.platform, preferred_fonts
+                self.platform, self._preferred_fonts
             )
             
             # 计算平台优先级
@@ -214,16 +442,8 @@ class FontDetector(LoggerMixin):
         # 从文件名提取
         name = font_path.stem
         
-        # 移除常见的后缀
-        suffixes_to_remove = [
-            'Regular', 'Bold', 'Italic', 'Light', 'Medium', 'Heavy',
-            'Thin', 'Black', 'Condensed', 'Extended', 'Narrow'
-        ]
-        
-        for suffix in suffixes_to_remove:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)].strip('-_ ')
-                break
+        # 移除常见的后缀（连同前面的分隔符）
+        name = self._SUFFIX_PATTERN.sub('', name, count=1)
         
         # 标准化名称
         name = normalize_font_name(name)
@@ -258,26 +478,10 @@ class FontDetector(LoggerMixin):
         Returns:
             FontWeight: 字体粗细
         """
-        name_lower = font_name.lower()
-        
-        if any(keyword in name_lower for keyword in ['thin', 'ultralight']):
-            return FontWeight.THIN
-        elif any(keyword in name_lower for keyword in ['extralight', 'ultralight']):
-            return FontWeight.EXTRA_LIGHT
-        elif any(keyword in name_lower for keyword in ['light']):
-            return FontWeight.LIGHT
-        elif any(keyword in name_lower for keyword in ['medium']):
-            return FontWeight.MEDIUM
-        elif any(keyword in name_lower for keyword in ['semibold', 'demibold']):
-            return FontWeight.SEMI_BOLD
-        elif any(keyword in name_lower for keyword in ['bold']):
-            return FontWeight.BOLD
-        elif any(keyword in name_lower for keyword in ['extrabold', 'ultrabold']):
-            return FontWeight.EXTRA_BOLD
-        elif any(keyword in name_lower for keyword in ['black', 'heavy']):
-            return FontWeight.BLACK
-        else:
-            return FontWeight.NORMAL
+        match = self._WEIGHT_PATTERN.search(font_name)
+        if match:
+            return self._WEIGHT_VALUES[match.lastindex - 1]
+        return FontWeight.NORMAL
     
     def _extract_font_style(self, font_name: str) -> FontStyle:
         """
@@ -289,14 +493,10 @@ class FontDetector(LoggerMixin):
         Returns:
             FontStyle: 字体样式
         """
-        name_lower = font_name.lower()
-        
-        if 'italic' in name_lower:
-            return FontStyle.ITALIC
-        elif 'oblique' in name_lower:
-            return FontStyle.OBLIQUE
-        else:
-            return FontStyle.NORMAL
+        match = self._STYLE_PATTERN.search(font_name)
+        if match:
+            return self._STYLE_VALUES[match.lastindex - 1]
+        return FontStyle.NORMAL
     
 
     
@@ -316,6 +516,24 @@ class FontDetector(LoggerMixin):
     
 
     
+    @staticmethod
+    def _rank_key(font: FontInfo) -> Tuple[bool, int, float, int]:
+        """
+        字体排序键
+        
+        Args:
+            font: 字体信息
+            
+        Returns:
+            Tuple[bool, int, float, int]: 排序键
+        """
+        return (
+            not font.supports_chinese,  # 中文支持优先
+            font.platform_priority,     # 平台优先级
+            -font.quality_score,        # 质量评分（降序）
+            len(font.name)              # 名称长度（简短优先）
+        )
+    
     def rank_fonts(self, fonts: List[FontInfo]) -> List[FontInfo]:
         """
         按质量和兼容性排序字体
@@ -328,16 +546,8 @@ class FontDetector(LoggerMixin):
         """
         self.logger.info(f"对 {len(fonts)} 个字体进行排序...")
         
-        # 多维度排序
-        def sort_key(font: FontInfo) -> Tuple[bool, int, float, int]:
-            return (
-                not font.supports_chinese,  # 中文支持优先
-                font.platform_priority,     # 平台优先级
-                -font.quality_score,        # 质量评分（降序）
-                len(font.name)              # 名称长度（简短优先）
-            )
-        
-        sorted_fonts = sorted(fonts, key=sort_key)
+        # 多维度排序（key对每个字体只计算一次，sorted本身即为装饰-排序-去装饰且稳定）
+        sorted_fonts = sorted(fonts, key=self._rank_key)
         
         self.logger.info("字体排序完成")
         if sorted_fonts:
@@ -359,18 +569,24 @@ class FontDetector(LoggerMixin):
         try:
             path = Path(font_path)
             
-            # 检查文件存在性
-            if not path.exists():
+            # 检查文件类型（仅检查扩展名，不访问文件系统）
+            if not has_font_extension(path):
+                self.logger.warning(f"不是有效的字体文件: {font_path}")
+                return False
+            
+            # 检查文件存在性，一次stat同时获取类型和大小
+            try:
+                file_stat = path.stat()
+            except OSError:
                 self.logger.warning(f"字体文件不存在: {font_path}")
                 return False
             
-            # 检查文件类型
-            if not is_font_file(path):
+            if not stat.S_ISREG(file_stat.st_mode):
                 self.logger.warning(f"不是有效的字体文件: {font_path}")
                 return False
             
             # 检查文件大小
-            file_size = get_file_size(path)
+            file_size = file_stat.st_size
             if file_size < 1024:  # 小于1KB
                 self.logger.warning(f"字体文件太小: {font_path} ({file_size} bytes)")
                 return False
@@ -393,6 +609,23 @@ class FontDetector(LoggerMixin):
             self.logger.error(f"字体文件验证出错: {font_path} - {e}")
             return False
     
+    def verify_fonts(self, font_paths: List[str]) -> List[bool]:
+        """
+        批量验证字体文件（文件较多时用线程池并行读取文件头）
+        
+        Args:
+            font_paths: 字体文件路径列表
+            
+        Returns:
+            List[bool]: 与font_paths一一对应的验证结果
+        """
+        if len(font_paths) >= self._PARALLEL_EXTRACT_THRESHOLD:
+            max_workers = min(32, (os.cpu_count() or 4) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(self.verify_font, font_paths))
+        
+        return [self.verify_font(font_path) for font_path in font_paths]
+    
     def find_font_by_name(self, font_name: str, fonts: Optional[List[FontInfo]] = None) -> Optional[FontInfo]:
         """
         按名称查找字体
@@ -404,23 +637,59 @@ class FontDetector(LoggerMixin):
         Returns:
             Optional[FontInfo]: 找到的字体，未找到返回None
         """
-        if fonts is None:
-            fonts = self.detect_system_fonts()
-        
         normalized_target = normalize_font_name(font_name).lower()
         
+        if fonts is None:
+            # 使用检测时建立的标准化名称索引，无需逐个标准化
+            if self._is_memory_cache_valid() and self._normalized_index:
+                font = self._normalized_index.get(normalized_target)
+                if font is not None:
+                    return font
+                for normalized_name, font in self._normalized_index.items():
+                    if normalized_target in normalized_name:
+                        return font
+                return None
+            
+            # 无缓存时边扫描边匹配，精确匹配后立即停止扫描
+            fuzzy_match = None
+            for font in self.iter_system_fonts():
+                if font.normalized_name == normalized_target:
+                    return font
+                if fuzzy_match is None and normalized_target in font.normalized_name:
+                    fuzzy_match = font
+            return fuzzy_match
+        
         # 精确匹配
         for font in fonts:
-            if normalize_font_name(font.name).lower() == normalized_target:
+            if font.normalized_name == normalized_target:
                 return font
         
         # 模糊匹配
         for font in fonts:
-            if normalized_target in normalize_font_name(font.name).lower():
+            if normalized_target in font.normalized_name:
                 return font
         
         return None
     
+    def detect_and_partition(self, force_rescan: bool = False) -> Tuple[List[FontInfo], List[FontInfo]]:
+        """
+        检测系统字体，同时返回排序后的中文字体
+        
+        Args:
+            force_rescan: 是否强制重新扫描
+            
+        Returns:
+            Tuple[List[FontInfo], List[FontInfo]]: (全部字体, 排序后的中文字体)
+        """
+        fonts = self.detect_system_fonts(force_rescan)
+        
+        # 检测结果未变化时复用上次的排序结果
+        if self._ranked_chinese is None:
+            self._ranked_chinese = self.rank_fonts(
+                [font for font in fonts if font.supports_chinese]
+            )
+        return fonts, list(self._ranked_chinese)
+    
     def get_chinese_fonts(self, fonts: Optional[List[FontInfo]] = None) -> List[FontInfo]:
         """
         获取支持中文的字体
@@ -432,7 +701,7 @@ class FontDetector(LoggerMixin):
             List[FontInfo]: 支持中文的字体列表
         """
         if fonts is None:
-            fonts = self.detect_system_fonts()
+            return self.detect_and_partition()[1]
         
         chinese_fonts = [font for font in fonts if font.supports_chinese]
         return self.rank_fonts(chinese_fonts)
@@ -440,8 +709,14 @@ class FontDetector(LoggerMixin):
     def clear_cache(self):
         """清除字体缓存"""
         self._font_cache.clear()
+        self._normalized_index.clear()
+        self._by_name.clear()
         self._scan_cache.clear()
+        self._ranked_chinese = None
         self._last_scan_time = 0
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+        self.adapter.refresh_dirs()
         self.logger.info("字体缓存已清除")
     
     @property
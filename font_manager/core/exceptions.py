@@ -33,17 +33,16 @@ class FontManagerError(Exception):
     
     def __str__(self) -> str:
         """返回格式化的错误信息"""
-        result = self.message
+        parts = [self.message]
         
         if self.details:
-            result += f"\n详细信息: {self.details}"
+            parts.append(f"详细信息: {self.details}")
         
         if self.suggestions:
-            result += "\n解决建议:"
-            for i, suggestion in enumerate(self.suggestions, 1):
-                result += f"\n  {i}. {suggestion}"
+            parts.append("解决建议:")
+            parts.extend(f"  {i}. {suggestion}" for i, suggestion in enumerate(self.suggestions, 1))
         
-        return result
+        return "\n".join(parts)
     
     def to_dict(self) -> dict:
         """转换为字典格式"""
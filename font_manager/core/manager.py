@@ -7,7 +7,8 @@ Font Manager Main Class
 """
 
 import time
-from typing import List, Optional, Dict, Any
+import warnings
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
 from .models import FontInfo, FontSetupResult, ValidationReport, Platform
@@ -19,6 +20,53 @@ from ..utils.logger import LoggerMixin
 from ..utils.helpers import get_platform
 
 
+# 健壮版设置优先选择的已知好字体（小写，按优先级排序）
+_ROBUST_PREFERRED_FONTS = (
+    'arial unicode ms',     # macOS最佳
+    'pingfang sc',          # macOS现代
+    'hiragino sans gb',     # macOS传统
+    'microsoft yahei',      # Windows最佳
+    'simhei',               # Windows传统
+    'wenquanyi micro hei',  # Linux
+    'dejavu sans'           # 通用备用
+)
+
+_matplotlib_warnings_ignored = False
+_matplotlib_modules = None  # (matplotlib, pyplot, font_manager)，首次使用时导入
+
+
+def _ignore_matplotlib_warnings():
+    """忽略matplotlib的字体相关警告（只安装一次过滤器）"""
+    global _matplotlib_warnings_ignored
+    if not _matplotlib_warnings_ignored:
+        warnings.filterwarnings('ignore', category=UserWarning, module='matplotlib')
+        _matplotlib_warnings_ignored = True
+
+
+def _import_matplotlib():
+    """
+    导入matplotlib相关模块并设置Agg后端（每个进程只执行一次）
+    
+    Returns:
+        tuple: (matplotlib, matplotlib.pyplot, matplotlib.font_manager)
+        
+    Raises:
+        ImportError: matplotlib未安装
+    """
+    global _matplotlib_modules
+    if _matplotlib_modules is None:
+        # 强制设置matplotlib后端，避免GUI问题
+        import matplotlib
+        matplotlib.use('Agg')
+        
+        import matplotlib.pyplot as plt
+        import matplotlib.font_manager as fm
+        
+        _matplotlib_modules = (matplotlib, plt, fm)
+    
+    return _matplotlib_modules
+
+
 class FontManager(LoggerMixin):
     """
     字体管理器主类
@@ -26,6 +74,9 @@ class FontManager(LoggerMixin):
     提供中文字体的自动检测、配置和管理功能。
     """
     
+    # 检测结果在实例上的缓存时间（秒）
+    _FONT_LIST_TTL = 3600
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         初始化字体管理器
@@ -36,11 +87,16 @@ class FontManager(LoggerMixin):
         self.config_path = config_path
         self.platform = get_platform()
         self._current_font: Optional[FontInfo] = None
+        self._fallback_fonts: List[str] = []
+        self._current_selector: Optional[Callable] = None  # 选出当前字体的选择函数，指定字体时为None
+        # (检测时间, 全部字体, 排序后的中文字体)
+        self._detected_fonts: Optional[Tuple[float, List[FontInfo], List[FontInfo]]] = None
+        self._last_applied: Optional[Tuple[str, Tuple[Tuple[str, Any], ...]]] = None  # (字体路径, 已设置的rcParams)
         
-        # 初始化组件
-        self.config_manager = ConfigManager(config_path)
-        self.detector = FontDetector(cache_enabled=True)
-        self.style_manager = StyleManager()
+        # 组件在首次访问时创建
+        self._config_manager: Optional[ConfigManager] = None
+        self._detector: Optional[FontDetector] = None
+        self._style_manager: Optional[StyleManager] = None
         
         self.logger.info(f"FontManager initialized on platform: {self.platform.value}")
     
@@ -54,34 +110,57 @@ class FontManager(LoggerMixin):
         Returns:
             FontSetupResult: 字体设置结果
         """
-        start_time = time.time()
+        return self._do_setup(self._select_best_chinese_font, force_rebuild, "中文字体设置")
+    
+    def _do_setup(
+        self,
+        selector: Callable[[List[FontInfo], List[FontInfo], FontSetupResult], Optional[FontInfo]],
+        force_rebuild: bool,
+        description: str,
+        reuse_any_configured: bool = False
+    ) -> FontSetupResult:
+        """
+        字体设置的公共流程：检测 -> 选择 -> 验证 -> 应用matplotlib配置
+        
+        Args:
+            selector: 字体选择函数，参数为 (全部字体, 排序后的中文字体, 设置结果)，
+                      负责填写备用字体，返回选中的字体
+            force_rebuild: 是否强制重建字体缓存
+            description: 日志中使用的设置方式描述
+            reuse_any_configured: 已配置任意字体时都直接复用（否则只复用同一选择函数选出的字体）
+            
+        Returns:
+            FontSetupResult: 字体设置结果
+        """
+        start_time = time.perf_counter()
         result = FontSetupResult(success=False, platform=self.platform)
         
+        # 已配置且不强制重建时，直接返回当前字体
+        if (self.is_configured and not force_rebuild
+                and (reuse_any_configured or self._current_selector is selector)):
+            # rcParams可能已被重置或修改（如plt.rcdefaults()），重新应用；未变化时立即返回
+            self._apply_matplotlib_config(self._current_font)
+            result.success = True
+            result.font_used = self._current_font
+            result.fallback_fonts = list(self._fallback_fonts)
+            result.setup_time = time.perf_counter() - start_time
+            self.logger.info(f"字体已配置: {self._current_font.name}")
+            return result
+        
         try:
-            self.logger.info("开始设置中文字体...")
+            self.logger.info(f"开始{description}...")
             
-            # 检测系统字体
-            fonts = self.detector.detect_system_fonts(force_rescan=force_rebuild)
+            # 检测系统字体，同时得到排序后的中文字体
+            fonts, chinese_fonts = self._detect_and_partition(force_rebuild)
             
             if not fonts:
                 result.add_error("未检测到任何字体")
                 return result
             
-            # 获取支持中文的字体
-            chinese_fonts = self.detector.get_chinese_fonts(fonts)
-            
-            if not chinese_fonts:
-                result.add_warning("未找到支持中文的字体，使用默认字体")
-                # 使用第一个可用字体
-                if fonts:
-                    font_info = fonts[0]
-                else:
-                    result.add_error("没有可用字体")
-                    return result
-            else:
-                # 使用最佳中文字体
-                font_info = chinese_fonts[0]
-                result.fallback_fonts = [f.name for f in chinese_fonts[1:6]]  # 前5个备用字体
+            font_info = selector(fonts, chinese_fonts, result)
+            if not font_info:
+                result.add_error("没有可用字体")
+                return result
             
             # 验证字体文件
             if not self.detector.verify_font(font_info.path):
@@ -89,23 +168,80 @@ class FontManager(LoggerMixin):
             
             # 设置当前字体
             self._current_font = font_info
+            self._fallback_fonts = result.fallback_fonts
+            self._current_selector = selector
             result.font_used = font_info
             result.success = True
             
             # 应用matplotlib配置
-            self._apply_matplotlib_config(font_info)
+            self._apply_matplotlib_config(font_info, force_rebuild)
             
-            self.logger.info(f"成功设置字体: {font_info.name} (评分: {font_info.quality_score:.2f})")
+            self.logger.info(f"{description}成功: {font_info.name} (评分: {font_info.quality_score:.2f})")
                 
         except Exception as e:
-            self.logger.error(f"字体设置失败: {e}")
+            self.logger.error(f"{description}失败: {e}")
             result.add_error(str(e))
             
         finally:
-            result.setup_time = time.time() - start_time
+            result.setup_time = time.perf_counter() - start_time
             
         return result
     
+    @staticmethod
+    def _select_best_chinese_font(
+        fonts: List[FontInfo],
+        chinese_fonts: List[FontInfo],
+        result: FontSetupResult
+    ) -> Optional[FontInfo]:
+        """
+        选择评分最高的中文字体，没有中文字体时使用第一个可用字体
+        
+        Args:
+            fonts: 全部字体
+            chinese_fonts: 排序后的中文字体
+            result: 设置结果，用于记录备用字体和警告
+            
+        Returns:
+            Optional[FontInfo]: 选中的字体
+        """
+        if not chinese_fonts:
+            result.add_warning("未找到支持中文的字体，使用默认字体")
+            return fonts[0] if fonts else None
+        
+        result.fallback_fonts = [f.name for f in chinese_fonts[1:6]]  # 前5个备用字体
+        return chinese_fonts[0]
+    
+    @staticmethod
+    def _select_preferred_font(
+        fonts: List[FontInfo],
+        chinese_fonts: List[FontInfo],
+        result: FontSetupResult
+    ) -> Optional[FontInfo]:
+        """
+        优先选择已知的好字体，没有时使用第一个可用字体
+        
+        Args:
+            fonts: 全部字体
+            chinese_fonts: 排序后的中文字体（未使用）
+            result: 设置结果，用于记录备用字体
+            
+        Returns:
+            Optional[FontInfo]: 选中的字体
+        """
+        result.fallback_fonts = [f.name for f in fonts[1:6]]
+        
+        # 字体名称只转换一次小写
+        lowered_fonts = [(font.name.lower(), font) for font in fonts]
+        for preferred in _ROBUST_PREFERRED_FONTS:
+            selected_font = next(
+                (font for name_lower, font in lowered_fonts if preferred in name_lower), None
+            )
+            if selected_font:
+                return selected_font
+        
+        # 如果没找到首选字体，使用第一个可用字体
+        return fonts[0] if fonts else None
+    
     def get_available_fonts(self) -> List[FontInfo]:
         """
         获取可用字体列表
@@ -115,8 +251,8 @@ class FontManager(LoggerMixin):
         """
         self.logger.info("获取可用字体列表...")
         
-        # 使用字体检测器获取字体
-        fonts = self.detector.detect_system_fonts()
+        # 复用本实例已检测的字体列表
+        fonts = list(self._detect_fonts())
         
         self.logger.info(f"找到 {len(fonts)} 个可用字体")
         return fonts
@@ -138,14 +274,23 @@ class FontManager(LoggerMixin):
         success = self.style_manager.update_style(element, **kwargs)
         
         if success:
-            # 同时更新配置文件
-            current_style = self.config_manager.get_font_style(element)
+            # 同时更新配置（合并多次修改，延迟写入文件）
+            current_style = dict(self.config_manager.get_font_style(element))
             current_style.update(kwargs)
             self.config_manager.set_font_style(element, current_style)
-            self.config_manager.save_config()
+            self.config_manager.mark_dirty()
         
         return success
     
+    def flush_config(self) -> bool:
+        """
+        立即将未保存的配置修改写入配置文件
+        
+        Returns:
+            bool: 是否保存成功（无修改时返回True）
+        """
+        return self.config_manager.flush()
+    
     def validate(self) -> ValidationReport:
         """
         验证字体配置
@@ -153,7 +298,7 @@ class FontManager(LoggerMixin):
         Returns:
             ValidationReport: 验证报告
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         report = ValidationReport()
         
         try:
@@ -181,7 +326,7 @@ class FontManager(LoggerMixin):
             report.add_issue(f"验证过程出错: {e}")
             
         finally:
-            report.validation_time = time.time() - start_time
+            report.validation_time = time.perf_counter() - start_time
             
         self.logger.info(f"字体验证完成，状态: {report.status}")
         return report
@@ -198,35 +343,115 @@ class FontManager(LoggerMixin):
         # TODO: 实现测试图表生成逻辑
         pass
     
-    def _apply_matplotlib_config(self, font_info: FontInfo) -> None:
+    def _detect_fonts(self, force_rebuild: bool = False) -> List[FontInfo]:
+        """
+        检测系统字体
+        
+        Args:
+            force_rebuild: 是否强制重建字体缓存
+            
+        Returns:
+            List[FontInfo]: 检测到的字体列表
+        """
+        return self._detect_and_partition(force_rebuild)[0]
+    
+    def _detect_and_partition(self, force_rebuild: bool = False) -> Tuple[List[FontInfo], List[FontInfo]]:
+        """
+        检测系统字体并划分出中文字体
+        
+        非强制重建时复用本实例上次的检测结果（_FONT_LIST_TTL内有效），
+        setup及各兼容API共享同一份字体列表。
+        
+        Args:
+            force_rebuild: 是否强制重建字体缓存
+            
+        Returns:
+            Tuple[List[FontInfo], List[FontInfo]]: (全部字体, 排序后的中文字体)
+        """
+        if not force_rebuild and self._detected_fonts is not None:
+            detected_at, fonts, chinese_fonts = self._detected_fonts
+            if time.time() - detected_at < self._FONT_LIST_TTL:
+                return fonts, chinese_fonts
+        
+        fonts, chinese_fonts = self.detector.detect_and_partition(force_rescan=force_rebuild)
+        
+        self._detected_fonts = (time.time(), fonts, chinese_fonts)
+        return fonts, chinese_fonts
+    
+    def _get_matplotlib(self):
+        """
+        获取matplotlib相关模块（Agg后端在整个进程中只设置一次）
+        
+        Returns:
+            tuple: (matplotlib, matplotlib.pyplot, matplotlib.font_manager)
+            
+        Raises:
+            ImportError: matplotlib未安装
+        """
+        return _import_matplotlib()
+    
+    @staticmethod
+    def _refresh_matplotlib_font_list(fm) -> None:
+        """
+        重新扫描系统字体并就地更新matplotlib的字体列表
+        
+        findfont和各渲染后端绑定的是模块加载时的fontManager实例，
+        替换模块属性不会生效，因此把新扫描的字体列表复制到现有实例。
+        
+        Args:
+            fm: matplotlib.font_manager模块
+        """
+        fresh = fm._load_fontmanager(try_read_cache=False)
+        fm.fontManager.ttflist = fresh.ttflist
+        fm.fontManager.afmlist = fresh.afmlist
+        fm.fontManager._findfont_cached.cache_clear()
+    
+    def _apply_matplotlib_config(self, font_info: FontInfo, force_rebuild: bool = False) -> None:
         """
         应用matplotlib字体配置
         
         Args:
             font_info: 字体信息
+            force_rebuild: 是否强制重建matplotlib字体缓存
         """
         try:
-            # 强制设置matplotlib后端，避免GUI问题
-            import matplotlib
-            matplotlib.use('Agg')
-            
-            import matplotlib.pyplot as plt
-            import matplotlib.font_manager as fm
-            
-            # 设置字体参数
-            plt.rcParams.update({
-                'font.sans-serif': [font_info.name, 'Arial Unicode MS', 'DejaVu Sans', 'Arial'],
-                'axes.unicode_minus': False,
-                'font.family': 'sans-serif',
-                'figure.max_open_warning': 0  # 禁用打开图形过多的警告
-            })
-            
-            # 清理字体缓存
+            _, plt, fm = self._get_matplotlib()
+            rc = plt.rcParams
+            
+            # 同一字体已应用且rcParams未被外部修改时无需重复设置
+            if (not force_rebuild and self._last_applied is not None
+                    and self._last_applied[0] == font_info.path
+                    and all(rc[key] == value for key, value in self._last_applied[1])):
+                return
+            
+            # 仅在强制重建时重新扫描全部字体（matplotlib >= 3.4）
+            if force_rebuild and hasattr(fm, '_load_fontmanager'):
+                self._refresh_matplotlib_font_list(fm)
+            
+            # 只注册选中的字体文件，无需重建matplotlib的字体缓存
+            family_names = [font_info.name]
             try:
-                fm._rebuild()
-            except:
-                pass
-                
+                # 重复应用配置时跳过已注册的字体，避免ttflist中出现重复条目
+                if not any(entry.fname == font_info.path for entry in fm.fontManager.ttflist):
+                    fm.fontManager.addfont(font_info.path)
+                family_name = fm.FontProperties(fname=font_info.path).get_name()
+                if family_name != font_info.name:
+                    family_names.insert(0, family_name)
+            except Exception as e:
+                self.logger.debug(f"注册字体文件失败 {font_info.path}: {e}")
+            
+            # 设置字体参数，跳过未变化的键以避免重复校验
+            settings = (
+                ('font.sans-serif', family_names + ['Arial Unicode MS', 'DejaVu Sans', 'Arial']),
+                ('axes.unicode_minus', False),
+                ('font.family', ['sans-serif']),
+                ('figure.max_open_warning', 0)  # 禁用打开图形过多的警告
+            )
+            for key, value in settings:
+                if rc[key] != value:
+                    rc[key] = value
+            self._last_applied = (font_info.path, settings)
+            
             self.logger.debug(f"已应用matplotlib字体配置: {font_info.name}")
             
         except ImportError:
@@ -234,6 +459,27 @@ class FontManager(LoggerMixin):
         except Exception as e:
             self.logger.error(f"应用matplotlib配置失败: {e}")
     
+    @property
+    def config_manager(self) -> ConfigManager:
+        """获取配置管理器（首次访问时创建）"""
+        if self._config_manager is None:
+            self._config_manager = ConfigManager(self.config_path)
+        return self._config_manager
+    
+    @property
+    def detector(self) -> FontDetector:
+        """获取字体检测器（首次访问时创建）"""
+        if self._detector is None:
+            self._detector = FontDetector(cache_enabled=True)
+        return self._detector
+    
+    @property
+    def style_manager(self) -> StyleManager:
+        """获取样式管理器（首次访问时创建）"""
+        if self._style_manager is None:
+            self._style_manager = StyleManager()
+        return self._style_manager
+    
     @property
     def current_font(self) -> Optional[FontInfo]:
         """获取当前使用的字体"""
@@ -270,7 +516,7 @@ class FontManager(LoggerMixin):
         """
         result = self.config_manager.set(key, value)
         if result:
-            self.config_manager.save_config()
+            self.config_manager.mark_dirty()
         return result
     
     def get_preferred_fonts(self) -> List[str]:
@@ -294,7 +540,7 @@ class FontManager(LoggerMixin):
         """
         result = self.config_manager.set_preferred_fonts(fonts, self.platform)
         if result:
-            self.config_manager.save_config()
+            self.config_manager.mark_dirty()
         return result
     
     def reset_config(self) -> bool:
@@ -384,6 +630,15 @@ class FontManager(LoggerMixin):
         """
         return self.style_manager.apply_to_matplotlib(element, target)
     
+    def apply_theme_to_matplotlib(self) -> bool:
+        """
+        将当前主题的所有样式一次性应用到matplotlib全局配置
+        
+        Returns:
+            bool: 是否应用成功
+        """
+        return self.style_manager.apply_theme_to_rcparams()
+    
     def reset_styles(self):
         """重置所有样式为默认值"""
         self.style_manager.reset_to_default()
@@ -410,12 +665,8 @@ class FontManager(LoggerMixin):
         """
         if font_name:
             # 使用指定字体
-            fonts = self.detector.detect_system_fonts(force_rescan=force_rebuild)
-            target_font = None
-            for font in fonts:
-                if font.name == font_name:
-                    target_font = font
-                    break
+            self._detect_fonts(force_rebuild)
+            target_font = self.detector.get_by_name(font_name)
             
             if not target_font:
                 result = FontSetupResult(success=False, platform=self.platform)
@@ -424,7 +675,9 @@ class FontManager(LoggerMixin):
             
             # 设置指定字体
             self._current_font = target_font
-            self._apply_matplotlib_config(target_font)
+            self._fallback_fonts = []
+            self._current_selector = None
+            self._apply_matplotlib_config(target_font, force_rebuild)
             
             result = FontSetupResult(success=True, platform=self.platform)
             result.font_used = target_font
@@ -449,82 +702,9 @@ class FontManager(LoggerMixin):
         Returns:
             FontSetupResult: 字体设置结果
         """
-        import warnings
-        import gc
-        
         # 禁用字体相关警告
-        warnings.filterwarnings('ignore', category=UserWarning, module='matplotlib')
-        
-        start_time = time.time()
-        result = FontSetupResult(success=False, platform=self.platform)
+        _ignore_matplotlib_warnings()
         
-        try:
-            # 强制设置matplotlib后端
-            import matplotlib
-            matplotlib.use('Agg')
-            
-            self.logger.info("开始健壮版中文字体设置...")
-            
-            # 如果已经配置且不强制重建，直接返回
-            if self.is_configured and not force_rebuild:
-                result.success = True
-                result.font_used = self._current_font
-                result.setup_time = time.time() - start_time
-                self.logger.info(f"字体已配置: {self._current_font.name}")
-                return result
-            
-            # 检测系统字体
-            fonts = self.detector.detect_system_fonts(force_rescan=force_rebuild)
-            
-            if not fonts:
-                result.add_error("未检测到任何字体")
-                return result
-            
-            # 优先选择已知的好字体
-            preferred_fonts = [
-                'Arial Unicode MS',  # macOS最佳
-                'PingFang SC',       # macOS现代
-                'Hiragino Sans GB',  # macOS传统
-                'Microsoft YaHei',   # Windows最佳
-                'SimHei',           # Windows传统
-                'WenQuanYi Micro Hei', # Linux
-                'DejaVu Sans'       # 通用备用
-            ]
-            
-            selected_font = None
-            for preferred in preferred_fonts:
-                for font in fonts:
-                    if preferred.lower() in font.name.lower():
-                        selected_font = font
-                        break
-                if selected_font:
-                    break
-            
-            # 如果没找到首选字体，使用第一个可用字体
-            if not selected_font and fonts:
-                selected_font = fonts[0]
-            
-            if not selected_font:
-                result.add_error("没有可用字体")
-                return result
-            
-            # 设置字体
-            self._current_font = selected_font
-            self._apply_matplotlib_config(selected_font)
-            
-            result.success = True
-            result.font_used = selected_font
-            result.fallback_fonts = [f.name for f in fonts[1:6]]
-            
-            self.logger.info(f"健壮版字体设置成功: {selected_font.name}")
-            
-        except Exception as e:
-            self.logger.error(f"健壮版字体设置失败: {e}")
-            result.add_error(str(e))
-            
-        finally:
-            result.setup_time = time.time() - start_time
-            # 强制垃圾回收
-            gc.collect()
-            
-        return result
\ No newline at end of file
+        # 一次设置永久生效：已配置任意字体时直接复用
+        return self._do_setup(self._select_preferred_font, force_rebuild, "健壮版字体设置",
+                              reuse_any_configured=True)
\ No newline at end of file
@@ -6,11 +6,16 @@ Font Manager Data Models
 定义字体管理库使用的核心数据模型。
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
 
+# Python 3.10+ 支持dataclass(slots=True)，旧版本退回普通dataclass
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class FontWeight(Enum):
     """字体粗细枚举"""
     THIN = 100
@@ -39,12 +44,13 @@ class Platform(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FontInfo:
     """
     字体信息数据模型
     
     包含字体的基本信息、路径、样式属性和质量评分等。
+    每个系统字体对应一个实例，使用__slots__减少内存占用并加快属性访问。
     """
     name: str                           # 字体名称
     path: str                           # 字体文件路径
@@ -56,6 +62,7 @@ class FontInfo:
     platform_priority: int = 0         # 平台优先级 (数字越小优先级越高)
     file_size: int = 0                 # 文件大小 (字节)
     version: str = ""                  # 字体版本
+    _normalized_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """数据验证"""
@@ -64,6 +71,14 @@ class FontInfo:
         if self.platform_priority < 0:
             raise ValueError("platform_priority must be non-negative")
     
+    @property
+    def normalized_name(self) -> str:
+        """标准化的小写字体名称（首次访问时计算并缓存）"""
+        if self._normalized_name is None:
+            from ..utils.helpers import normalize_font_name
+            self._normalized_name = normalize_font_name(self.name).lower()
+        return self._normalized_name
+    
     @property
     def is_bold(self) -> bool:
         """是否为粗体"""
@@ -6,11 +6,11 @@ Style Manager
 样式管理器，负责字体样式的定义、应用和管理。
 """
 
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Any, Optional, List, Tuple, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
-from .models import FontWeight, FontStyle
+from .models import FontWeight, FontStyle, _SLOTS
 from .exceptions import FontConfigError
 from ..utils.logger import LoggerMixin
 
@@ -27,7 +27,61 @@ class ElementType(Enum):
     WATERMARK = "watermark"
 
 
-@dataclass
+# 应用到matplotlib对象时尝试的设置方法: (方法名, 属性键)
+_TARGET_SETTERS = (
+    ('set_fontsize', 'fontsize'),
+    ('set_color', 'color'),
+    ('set_weight', 'fontweight'),
+    ('set_style', 'fontstyle')
+)
+
+# 对象类型 -> 该类型支持的设置方法，避免每次调用都逐个hasattr探测
+_SETTER_CACHE: Dict[type, Tuple[Tuple[str, str], ...]] = {}
+
+# 应用到全局rcParams时各元素对应的参数: 元素名称 -> ((rcParams键, 属性键), ...)
+_RCPARAMS_BY_ELEMENT = {
+    ElementType.TITLE.value: (
+        ('axes.titlesize', 'fontsize'),
+        ('axes.titleweight', 'fontweight'),
+        ('axes.titlecolor', 'color')
+    ),
+    ElementType.AXIS_LABEL.value: (
+        ('axes.labelsize', 'fontsize'),
+        ('axes.labelweight', 'fontweight'),
+        ('axes.labelcolor', 'color')
+    ),
+    ElementType.TICK_LABEL.value: (
+        ('xtick.labelsize', 'fontsize'),
+        ('ytick.labelsize', 'fontsize'),
+        ('xtick.color', 'color'),
+        ('ytick.color', 'color')
+    ),
+    ElementType.LEGEND.value: (
+        ('legend.fontsize', 'fontsize'),
+    )
+}
+
+_rc_params = None  # matplotlib.rcParams，首次使用时导入
+
+
+def _get_rc_params():
+    """
+    获取matplotlib全局rcParams（matplotlib为可选依赖，首次使用时才导入）
+    
+    Returns:
+        matplotlib.RcParams: 全局rcParams
+        
+    Raises:
+        ImportError: matplotlib未安装
+    """
+    global _rc_params
+    if _rc_params is None:
+        import matplotlib
+        _rc_params = matplotlib.rcParams
+    return _rc_params
+
+
+@dataclass(**_SLOTS)
 class FontStyleConfig:
     """
     字体样式配置
@@ -40,6 +94,14 @@ class FontStyleConfig:
     font_style: str = "normal"         # 字体样式
     color: str = "black"               # 字体颜色
     alpha: float = 1.0                 # 透明度
+    # to_matplotlib_props的计算结果，任一字段被修改时失效
+    _mpl_props: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any):
+        """修改字段时清除matplotlib属性缓存"""
+        object.__setattr__(self, name, value)
+        if name != '_mpl_props':
+            object.__setattr__(self, '_mpl_props', None)
     
     def __post_init__(self):
         """数据验证"""
@@ -49,7 +111,17 @@ class FontStyleConfig:
             raise ValueError("alpha must be between 0.0 and 1.0")
     
     def to_matplotlib_props(self) -> Dict[str, Any]:
-        """转换为matplotlib字体属性"""
+        """转换为matplotlib字体属性（结果缓存，返回副本）"""
+        return dict(self._cached_matplotlib_props())
+    
+    def _cached_matplotlib_props(self) -> Dict[str, Any]:
+        """获取缓存的matplotlib字体属性（供内部只读使用，调用方不得修改）"""
+        if self._mpl_props is None:
+            object.__setattr__(self, '_mpl_props', self._build_matplotlib_props())
+        return self._mpl_props
+    
+    def _build_matplotlib_props(self) -> Dict[str, Any]:
+        """构建matplotlib字体属性"""
         props = {
             'fontsize': self.font_size,
             'color': self.color,
@@ -77,8 +149,15 @@ class FontStyleConfig:
         return props
     
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典格式"""
-        return asdict(self)
+        """转换为字典格式（字段均为标量，无需asdict的递归深拷贝）"""
+        return {
+            'font_family': self.font_family,
+            'font_size': self.font_size,
+            'font_weight': self.font_weight,
+            'font_style': self.font_style,
+            'color': self.color,
+            'alpha': self.alpha
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FontStyleConfig':
@@ -87,13 +166,14 @@ class FontStyleConfig:
     
     def copy(self) -> 'FontStyleConfig':
         """创建副本"""
-        return FontStyleConfig(**asdict(self))
+        return FontStyleConfig(
+            self.font_family, self.font_size, self.font_weight,
+            self.font_style, self.color, self.alpha
+        )
     
     def update(self, **kwargs) -> 'FontStyleConfig':
         """更新样式属性"""
-        data = asdict(self)
-        data.update(kwargs)
-        return FontStyleConfig(**data)
+        return replace(self, **kwargs)
 
 
 class StyleTheme:
@@ -132,7 +212,8 @@ class StyleTheme:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StyleTheme':
         """从字典创建StyleTheme实例"""
-        styles = {k: FontStyleConfig.from_dict(v) for k, v in data['styles'].items()}
+        style_data = data['styles']
+        styles = dict(zip(style_data, map(FontStyleConfig.from_dict, style_data.values())))
         return cls(data['name'], styles)
 
 
@@ -147,16 +228,38 @@ class StyleManager(LoggerMixin):
         """初始化样式管理器"""
         self._current_theme: Optional[StyleTheme] = None
         self._custom_styles: Dict[str, FontStyleConfig] = {}
-        self._themes: Dict[str, StyleTheme] = {}
         
-        # 初始化默认主题
-        self._init_default_themes()
+        # 内置主题在首次使用时创建，未创建的主题值为None
+        self._theme_factories: Dict[str, Callable[[], StyleTheme]] = {
+            "default": self._build_default_theme,
+            "academic": self._build_academic_theme,
+            "business": self._build_business_theme
+        }
+        self._themes: Dict[str, Optional[StyleTheme]] = dict.fromkeys(self._theme_factories)
+        
+        # 设置默认主题
+        self._current_theme = self._get_theme("default")
         
         self.logger.info("StyleManager initialized")
     
-    def _init_default_themes(self):
-        """初始化默认主题"""
-        # 默认主题
+    def _get_theme(self, theme_name: str) -> Optional[StyleTheme]:
+        """
+        获取主题，内置主题首次访问时创建
+        
+        Args:
+            theme_name: 主题名称
+            
+        Returns:
+            Optional[StyleTheme]: 主题，不存在时返回None
+        """
+        theme = self._themes.get(theme_name)
+        if theme is None and theme_name in self._theme_factories:
+            theme = self._theme_factories[theme_name]()
+            self._themes[theme_name] = theme
+        return theme
+    
+    def _build_default_theme(self) -> StyleTheme:
+        """创建默认主题"""
         default_styles = {
             ElementType.TITLE.value: FontStyleConfig(
                 font_size=16, font_weight=700, color="black"
@@ -184,9 +287,10 @@ class StyleManager(LoggerMixin):
             )
         }
         
-        self._themes["default"] = StyleTheme("默认主题", default_styles)
-        
-        # 学术论文主题
+        return StyleTheme("默认主题", default_styles)
+    
+    def _build_academic_theme(self) -> StyleTheme:
+        """创建学术论文主题"""
         academic_styles = {
             ElementType.TITLE.value: FontStyleConfig(
                 font_size=14, font_weight=700, color="black"
@@ -214,9 +318,10 @@ class StyleManager(LoggerMixin):
             )
         }
         
-        self._themes["academic"] = StyleTheme("学术论文", academic_styles)
-        
-        # 商业报告主题
+        return StyleTheme("学术论文", academic_styles)
+    
+    def _build_business_theme(self) -> StyleTheme:
+        """创建商业报告主题"""
         business_styles = {
             ElementType.TITLE.value: FontStyleConfig(
                 font_size=18, font_weight=800, color="navy"
@@ -244,10 +349,7 @@ class StyleManager(LoggerMixin):
             )
         }
         
-        self._themes["business"] = StyleTheme("商业报告", business_styles)
-        
-        # 设置默认主题
-        self._current_theme = self._themes["default"]
+        return StyleTheme("商业报告", business_styles)
     
     def get_available_themes(self) -> List[str]:
         """获取可用主题列表"""
@@ -268,7 +370,7 @@ class StyleManager(LoggerMixin):
             bool: 是否设置成功
         """
         if theme_name in self._themes:
-            self._current_theme = self._themes[theme_name]
+            self._current_theme = self._get_theme(theme_name)
             self.logger.info(f"主题已切换到: {theme_name}")
             return True
         else:
@@ -286,12 +388,11 @@ class StyleManager(LoggerMixin):
         Returns:
             StyleTheme: 新创建的主题
         """
-        if base_theme and base_theme in self._themes:
-            base = self._themes[base_theme]
-            styles = {k: v.copy() for k, v in base.styles.items()}
-        else:
-            base = self._themes["default"]
-            styles = {k: v.copy() for k, v in base.styles.items()}
+        if not base_theme or base_theme not in self._themes:
+            base_theme = "default"
+        
+        # 样式对象可变，需逐个复制，避免新主题修改影响基础主题
+        styles = {k: v.copy() for k, v in self._get_theme(base_theme).styles.items()}
         
         theme = StyleTheme(name, styles)
         self._themes[name] = theme
@@ -318,7 +419,7 @@ class StyleManager(LoggerMixin):
             
             # 如果删除的是当前主题，切换到默认主题
             if self._current_theme and self._current_theme.name == theme_name:
-                self._current_theme = self._themes["default"]
+                self._current_theme = self._get_theme("default")
             
             self.logger.info(f"主题已删除: {theme_name}")
             return True
@@ -336,13 +437,14 @@ class StyleManager(LoggerMixin):
         Returns:
             Optional[FontStyleConfig]: 样式配置
         """
-        # 优先使用自定义样式
-        if element in self._custom_styles:
-            return self._custom_styles[element]
+        # 优先使用自定义样式（单次查找）
+        style = self._custom_styles.get(element)
+        if style is not None:
+            return style
         
         # 使用当前主题的样式
         if self._current_theme:
-            return self._current_theme.get_style(element)
+            return self._current_theme.styles.get(element)
         
         return None
     
@@ -443,54 +545,57 @@ class StyleManager(LoggerMixin):
             return False
         
         try:
-            props = style.to_matplotlib_props()
+            props = style._cached_matplotlib_props()
             
             if target is None:
                 # 应用到全局rcParams
-                import matplotlib.pyplot as plt
-                
-                if element == ElementType.TITLE.value:
-                    plt.rcParams.update({
-                        'axes.titlesize': props['fontsize'],
-                        'axes.titleweight': props.get('fontweight', 'normal'),
-                        'axes.titlecolor': props['color']
-                    })
-                elif element == ElementType.AXIS_LABEL.value:
-                    plt.rcParams.update({
-                        'axes.labelsize': props['fontsize'],
-                        'axes.labelweight': props.get('fontweight', 'normal'),
-                        'axes.labelcolor': props['color']
-                    })
-                elif element == ElementType.TICK_LABEL.value:
-                    plt.rcParams.update({
-                        'xtick.labelsize': props['fontsize'],
-                        'ytick.labelsize': props['fontsize'],
-                        'xtick.color': props['color'],
-                        'ytick.color': props['color']
-                    })
-                elif element == ElementType.LEGEND.value:
-                    plt.rcParams.update({
-                        'legend.fontsize': props['fontsize']
-                    })
+                rc_keys = _RCPARAMS_BY_ELEMENT.get(element)
+                if rc_keys:
+                    _get_rc_params().update({rc_key: props[key] for rc_key, key in rc_keys})
                 
             else:
-                # 应用到特定对象
-                if hasattr(target, 'set_fontsize'):
-                    target.set_fontsize(props['fontsize'])
-                if hasattr(target, 'set_color'):
-                    target.set_color(props['color'])
-                if hasattr(target, 'set_weight'):
-                    target.set_weight(props.get('fontweight', 'normal'))
-                if hasattr(target, 'set_style'):
-                    target.set_style(props.get('fontstyle', 'normal'))
+                # 应用到特定对象（按类型缓存支持的设置方法）
+                target_type = type(target)
+                setters = _SETTER_CACHE.get(target_type)
+                if setters is None:
+                    setters = tuple(setter for setter in _TARGET_SETTERS if hasattr(target, setter[0]))
+                    _SETTER_CACHE[target_type] = setters
+                
+                for method_name, key in setters:
+                    getattr(target, method_name)(props[key])
             
-            self.logger.debug(f"样式已应用到matplotlib: {element}")
+            # 每个图表元素都会调用，使用延迟格式化（DEBUG未启用时不拼接字符串）
+            self.logger.debug("样式已应用到matplotlib: %s", element)
             return True
             
         except Exception as e:
             self.logger.error(f"应用样式到matplotlib失败: {e}")
             return False
     
+    def apply_theme_to_rcparams(self) -> bool:
+        """
+        将当前所有元素的样式一次性应用到全局rcParams
+        
+        与逐个调用apply_to_matplotlib相比，只执行一次rcParams.update。
+        
+        Returns:
+            bool: 是否应用成功
+        """
+        rc_updates = {}
+        for element, rc_keys in _RCPARAMS_BY_ELEMENT.items():
+            style = self.get_style(element)
+            if style:
+                props = style._cached_matplotlib_props()
+                rc_updates.update({rc_key: props[key] for rc_key, key in rc_keys})
+        
+        try:
+            _get_rc_params().update(rc_updates)
+            self.logger.debug(f"主题样式已应用到rcParams: {len(rc_updates)} 项")
+            return True
+        except Exception as e:
+            self.logger.error(f"应用主题样式到rcParams失败: {e}")
+            return False
+    
     def get_style_summary(self) -> Dict[str, Any]:
         """
         获取样式摘要信息
@@ -521,7 +626,7 @@ class StyleManager(LoggerMixin):
             Optional[Dict[str, Any]]: 主题配置字典
         """
         if theme_name in self._themes:
-            return self._themes[theme_name].to_dict()
+            return self._get_theme(theme_name).to_dict()
         else:
             self.logger.warning(f"主题不存在: {theme_name}")
             return None
@@ -548,5 +653,5 @@ class StyleManager(LoggerMixin):
     def reset_to_default(self):
         """重置为默认状态"""
         self._custom_styles.clear()
-        self._current_theme = self._themes["default"]
+        self._current_theme = self._get_theme("default")
         self.logger.info("样式管理器已重置为默认状态")
\ No newline at end of file
@@ -9,8 +9,9 @@ Font Manager Helper Functions
 import os
 import sys
 import platform
+import functools
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Tuple, Union
 import re
 
 from ..core.models import Platform
@@ -35,6 +36,34 @@ def get_platform() -> Platform:
         return Platform.UNKNOWN
 
 
+# 支持的字体文件扩展名
+FONT_EXTENSIONS = frozenset({
+    '.ttf',   # TrueType Font
+    '.otf',   # OpenType Font
+    '.ttc',   # TrueType Collection
+    '.otc',   # OpenType Collection
+    '.woff',  # Web Open Font Format
+    '.woff2', # Web Open Font Format 2
+    '.eot',   # Embedded OpenType
+    '.pfb',   # PostScript Font Binary
+    '.pfm',   # PostScript Font Metrics
+    '.afm',   # Adobe Font Metrics
+})
+
+
+def has_font_extension(file_path: Union[str, Path]) -> bool:
+    """
+    仅根据扩展名判断是否为字体文件（不访问文件系统）
+    
+    Args:
+        file_path: 文件路径
+        
+    Returns:
+        bool: 扩展名是否为字体格式
+    """
+    return os.path.splitext(str(file_path))[1].lower() in FONT_EXTENSIONS
+
+
 def is_font_file(file_path: Union[str, Path]) -> bool:
     """
     检查文件是否为字体文件
@@ -45,27 +74,11 @@ def is_font_file(file_path: Union[str, Path]) -> bool:
     Returns:
         bool: 是否为字体文件
     """
-    if isinstance(file_path, str):
-        file_path = Path(file_path)
-    
-    if not file_path.exists() or not file_path.is_file():
+    # 先做纯字符串的扩展名检查，再访问文件系统
+    if not has_font_extension(file_path):
         return False
     
-    # 支持的字体文件扩展名
-    font_extensions = {
-        '.ttf',   # TrueType Font
-        '.otf',   # OpenType Font
-        '.ttc',   # TrueType Collection
-        '.otc',   # OpenType Collection
-        '.woff',  # Web Open Font Format
-        '.woff2', # Web Open Font Format 2
-        '.eot',   # Embedded OpenType
-        '.pfb',   # PostScript Font Binary
-        '.pfm',   # PostScript Font Metrics
-        '.afm',   # Adobe Font Metrics
-    }
-    
-    return file_path.suffix.lower() in font_extensions
+    return os.path.isfile(file_path)
 
 
 def get_file_size(file_path: Union[str, Path]) -> int:
@@ -90,6 +103,39 @@ def get_file_size(file_path: Union[str, Path]) -> int:
         return 0
 
 
+def filter_existing_files(file_paths: List[str]) -> List[str]:
+    """
+    批量过滤出存在的文件
+    
+    按父目录分组，每个目录只读取一次目录项，
+    代替对每个文件单独调用os.path.exists。
+    
+    Args:
+        file_paths: 文件路径列表
+    
+    Returns:
+        List[str]: 存在的文件路径列表（保持原有顺序）
+    """
+    dir_entries = {}
+    existing = []
+    
+    for file_path in file_paths:
+        parent, name = os.path.split(file_path)
+        names = dir_entries.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent or '.') as it:
+                    names = {os.path.normcase(entry.name) for entry in it if entry.is_file()}
+            except OSError:
+                names = set()
+            dir_entries[parent] = names
+        
+        if os.path.normcase(name) in names:
+            existing.append(file_path)
+    
+    return existing
+
+
 def normalize_font_name(font_name: str) -> str:
     """
     标准化字体名称
@@ -128,6 +174,28 @@ def normalize_font_name(font_name: str) -> str:
     return normalized
 
 
+# 平台兼容性加分关键词（小写）
+_PLATFORM_BONUS_KEYWORDS = {
+    Platform.MACOS: ('hiragino', 'pingfang', 'stheiti'),
+    Platform.WINDOWS: ('microsoft', 'simhei', 'simsun'),
+    Platform.LINUX: ('noto', 'wenquanyi', 'droid')
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _normalize_preferred_fonts(preferred_fonts: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    标准化首选字体列表（同一列表只计算一次）
+    
+    Args:
+        preferred_fonts: 首选字体名称元组
+        
+    Returns:
+        Tuple[str, ...]: 标准化后的字体名称元组
+    """
+    return tuple(normalize_font_name(preferred) for preferred in preferred_fonts)
+
+
 def calculate_font_score(
     font_name: str,
     supports_chinese: bool,
@@ -157,10 +225,11 @@ def calculate_font_score(
     # 字体名称匹配度 (30%)
     if preferred_fonts:
         normalized_name = normalize_font_name(font_name)
-        for i, preferred in enumerate(preferred_fonts):
-            if normalize_font_name(preferred) in normalized_name:
+        normalized_preferred = _normalize_preferred_fonts(tuple(preferred_fonts))
+        for i, preferred in enumerate(normalized_preferred):
+            if preferred in normalized_name:
                 # 越靠前的字体得分越高
-                score += 0.3 * (1.0 - i / len(preferred_fonts))
+                score += 0.3 * (1.0 - i / len(normalized_preferred))
                 break
     
     # 文件大小合理性 (20%)
@@ -180,22 +249,31 @@ def calculate_font_score(
             score += 0.2 * (ideal_max / file_size)
     
     # 平台兼容性 (10%)
-    platform_bonus = {
-        Platform.MACOS: ['Hiragino', 'PingFang', 'STHeiti'],
-        Platform.WINDOWS: ['Microsoft', 'SimHei', 'SimSun'],
-        Platform.LINUX: ['Noto', 'WenQuanYi', 'Droid']
-    }
-    
-    if platform in platform_bonus:
-        for keyword in platform_bonus[platform]:
-            if keyword.lower() in font_name.lower():
-                score += 0.1
-                break
+    bonus_keywords = _PLATFORM_BONUS_KEYWORDS.get(platform)
+    if bonus_keywords:
+        name_lower = font_name.lower()
+        if any(keyword in name_lower for keyword in bonus_keywords):
+            score += 0.1
     
     # 确保评分在0-1范围内
     return min(1.0, max(0.0, score))
 
 
+def compile_keyword_pattern(keywords) -> "re.Pattern":
+    """
+    将关键词集合编译为单个正则表达式，一次扫描即可判断是否包含任一关键词
+    
+    Args:
+        keywords: 小写关键词集合
+        
+    Returns:
+        re.Pattern: 编译后的正则表达式
+    """
+    # 长关键词优先，保证多词名称优先匹配
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(keyword) for keyword in ordered))
+
+
 def find_files_by_pattern(
     directory: Union[str, Path],
     pattern: str,
@@ -227,6 +305,71 @@ def find_files_by_pattern(
         return []
 
 
+def iter_font_entries(
+    directory: Union[str, Path],
+    extensions: Tuple[str, ...],
+    recursive: bool = True
+) -> Iterator[os.DirEntry]:
+    """
+    遍历目录，一次遍历匹配所有扩展名，返回目录项
+    
+    os.DirEntry会缓存stat结果，后续读取文件大小无需再次stat。
+    不进入符号链接目录和隐藏目录，避免链接循环和无关的大目录树。
+    每个目录的条目按名称排序，保证遍历顺序与文件系统无关。
+    
+    Args:
+        directory: 搜索目录
+        extensions: 小写扩展名元组 (如 ('.ttf', '.otf'))
+        recursive: 是否递归搜索子目录
+        
+    Yields:
+        os.DirEntry: 匹配的文件目录项
+    """
+    stack = [str(directory)]
+    
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        
+        # 子目录逆序入栈，出栈时按名称顺序遍历
+        subdirs = []
+        for entry in entries:
+            try:
+                # 不跟随符号链接，跳过隐藏目录（如.DocumentRevisions-V100）
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and not entry.name.startswith('.'):
+                        subdirs.append(entry.path)
+                elif entry.name.lower().endswith(extensions) and entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+def iter_files_by_extension(
+    directory: Union[str, Path],
+    extensions: Tuple[str, ...],
+    recursive: bool = True
+) -> Iterator[str]:
+    """
+    遍历目录，一次遍历匹配所有扩展名
+    
+    Args:
+        directory: 搜索目录
+        extensions: 小写扩展名元组 (如 ('.ttf', '.otf'))
+        recursive: 是否递归搜索子目录
+        
+    Yields:
+        str: 匹配的文件路径
+    """
+    for entry in iter_font_entries(directory, extensions, recursive):
+        yield entry.path
+
+
 def safe_path_join(*parts: str) -> Path:
     """
     安全地连接路径组件
@@ -186,6 +186,158 @@ def test_config_formats():
         return False
 
 
+def test_yaml_edit_within_same_mtime(tmp_path):
+    """测试手动修改YAML后即使修改时间不晚于JSON副本也会读取新内容"""
+    print("\n📝 测试YAML手动修改...")
+    
+    import os
+    
+    yaml_path = tmp_path / "config.yaml"
+    config_manager = ConfigManager(str(yaml_path))
+    config_manager.load_config()
+    config_manager.set('test_key', 'old')
+    config_manager.save_config()
+    
+    sidecar_path = yaml_path.with_name(yaml_path.name + '.json')
+    sidecar_mtime = os.stat(sidecar_path).st_mtime_ns
+    
+    # 模拟粗粒度时间戳：修改后的YAML与JSON副本修改时间相同
+    yaml_path.write_text(
+        yaml_path.read_text(encoding='utf-8').replace('test_key: old', 'test_key: edited by hand'),
+        encoding='utf-8'
+    )
+    os.utime(yaml_path, ns=(sidecar_mtime, sidecar_mtime))
+    
+    assert ConfigManager(str(yaml_path)).get('test_key') == 'edited by hand'
+    print("✅ 读取到手动修改的YAML内容")
+
+
+def _counting_config_manager(config_path):
+    """创建记录写入次数的配置管理器"""
+    config_manager = ConfigManager(str(config_path))
+    config_manager.load_config()
+    # 延长延迟，保证断言在定时器触发前完成
+    config_manager._SAVE_DELAY = 0.5
+    
+    writes = []
+    write_config = config_manager._write_config
+    
+    def counting_write(*args, **kwargs):
+        writes.append(args)
+        return write_config(*args, **kwargs)
+    
+    config_manager._write_config = counting_write
+    return config_manager, writes
+
+
+def _read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_deferred_writes_coalesce(tmp_path):
+    """测试延迟写入期间的多次修改合并为一次写入"""
+    print("\n⏱️ 测试延迟写入合并...")
+    
+    config_path = tmp_path / "config.json"
+    config_manager, writes = _counting_config_manager(config_path)
+    
+    for value in ('a', 'b', 'c'):
+        config_manager.set('test_key', value)
+        config_manager.mark_dirty()
+    
+    # 修改尚未写入文件
+    timer = config_manager._save_timer
+    assert timer is not None
+    assert 'test_key' not in _read_json(config_path)
+    
+    timer.join()
+    assert len(writes) == 1
+    assert _read_json(config_path)['test_key'] == 'c'
+    print("✅ 三次修改合并为一次写入")
+
+
+def test_flush_writes_immediately(tmp_path):
+    """测试flush立即写入未保存的修改"""
+    print("\n💾 测试立即写入...")
+    
+    config_path = tmp_path / "config.json"
+    config_manager, writes = _counting_config_manager(config_path)
+    
+    config_manager.set('test_key', 'flushed')
+    config_manager.mark_dirty()
+    timer = config_manager._save_timer
+    
+    assert config_manager.flush()
+    assert _read_json(config_path)['test_key'] == 'flushed'
+    assert config_manager._save_timer is None
+    
+    # 已无修改时再次flush和定时器触发都不会重复写入
+    assert config_manager.flush()
+    timer.join()
+    assert len(writes) == 1
+    print("✅ flush后文件立即更新")
+
+
+def test_save_config_cancels_pending_write(tmp_path):
+    """测试save_config取消等待中的延迟写入"""
+    print("\n🛑 测试保存时取消延迟写入...")
+    
+    config_path = tmp_path / "config.json"
+    config_manager, writes = _counting_config_manager(config_path)
+    
+    config_manager.set('test_key', 'saved')
+    config_manager.mark_dirty()
+    timer = config_manager._save_timer
+    
+    assert config_manager.save_config()
+    assert config_manager._save_timer is None
+    
+    timer.join()
+    assert len(writes) == 1
+    assert _read_json(config_path)['test_key'] == 'saved'
+    print("✅ 延迟写入已取消")
+
+
+def test_deferred_write_retries_after_failure(tmp_path):
+    """测试延迟写入失败后仍会重试，之后的修改也能写入文件"""
+    print("\n🔁 测试延迟写入失败重试...")
+    
+    from font_manager.core.exceptions import FontConfigError
+    
+    config_path = tmp_path / "config.json"
+    config_manager, writes = _counting_config_manager(config_path)
+    
+    # 第一次写入失败
+    write_config = config_manager._write_config
+    
+    def failing_once(*args, **kwargs):
+        if len(writes) == 0:
+            writes.append(args)
+            raise FontConfigError(str(config_path), "模拟写入失败")
+        return write_config(*args, **kwargs)
+    
+    config_manager._write_config = failing_once
+    
+    config_manager.set('test_key', 'v1')
+    config_manager.mark_dirty()
+    first_timer = config_manager._save_timer
+    first_timer.join()
+    assert len(writes) == 1
+    assert 'test_key' not in _read_json(config_path)
+    
+    # 失败后已重新安排写入，新的修改随重试一起写入
+    retry_timer = config_manager._save_timer
+    assert retry_timer is not None and retry_timer is not first_timer
+    config_manager.set('test_key', 'v2')
+    config_manager.mark_dirty()
+    config_manager._save_timer.join()
+    assert len(writes) == 2
+    assert _read_json(config_path)['test_key'] == 'v2'
+    assert config_manager._save_timer is None
+    print("✅ 写入失败后重试成功")
+
+
 def test_config_validation():
     """测试配置验证功能"""
     print("\n🔍 测试配置验证...")
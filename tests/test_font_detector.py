@@ -6,6 +6,7 @@ Font Detector 测试脚本
 测试字体检测器的功能。
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -69,6 +70,11 @@ def test_font_detector():
             test_font = fonts[0]
             is_valid = detector.verify_font(test_font.path)
             print(f"✅ 字体验证: {test_font.name} - {'有效' if is_valid else '无效'}")
+            
+            batch_results = detector.verify_fonts([font.path for font in fonts])
+            assert len(batch_results) == len(fonts)
+            assert batch_results[0] == is_valid
+            print(f"✅ 批量验证: {sum(batch_results)}/{len(fonts)} 个字体有效")
         
         # 按名称查找字体
         print("\n6️⃣ 测试按名称查找字体...")
@@ -138,6 +144,141 @@ def test_integration_with_manager():
         return False
 
 
+def test_disk_cache(tmp_path):
+    """测试字体列表磁盘缓存"""
+    print("\n💾 测试字体列表磁盘缓存...")
+    
+    from font_manager.core.cache import FontListCache
+    from font_manager.core.models import FontInfo
+    
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    cache = FontListCache(tmp_path / "fonts-v1.json")
+    fonts = [FontInfo(name="TestFont", path=str(font_dir / "TestFont.ttf"), family="TestFont")]
+    
+    # 未保存时无缓存
+    assert cache.load([font_dir]) is None
+    
+    # 保存后目录未变化，命中缓存
+    assert cache.save([font_dir], fonts)
+    cached = cache.load([font_dir])
+    assert cached == fonts
+    print(f"✅ 缓存命中: {len(cached)} 个字体")
+    
+    # 目录内容变化后缓存失效
+    (font_dir / "NewFont.ttf").write_bytes(b"\0" * 2048)
+    os.utime(font_dir, ns=(0, 0))
+    assert cache.load([font_dir]) is None
+    print("✅ 目录变化后缓存失效")
+    
+    # 目录变化后仍可按文件复用字体信息
+    assert cache.save([font_dir], fonts, {fonts[0].path: (123, 4567)})
+    index = cache.load_file_index()
+    assert index == {fonts[0].path: (123, 4567, fonts[0])}
+    print("✅ 逐文件索引可复用")
+    
+    # 隐藏目录和符号链接目录不参与缓存校验（扫描时同样跳过）
+    (font_dir / ".hidden").mkdir()
+    os.symlink(tmp_path, font_dir / "link")
+    assert cache.save([font_dir], fonts)
+    os.utime(font_dir / ".hidden", ns=(0, 0))
+    os.utime(tmp_path, ns=(0, 0))
+    assert cache.load([font_dir]) == fonts
+    print("✅ 隐藏目录变化不影响缓存")
+
+
+def test_scan_skips_hidden_and_symlinked_dirs(tmp_path):
+    """测试目录扫描跳过隐藏目录和符号链接目录"""
+    print("\n📂 测试字体目录扫描...")
+    
+    from font_manager.utils.helpers import iter_font_entries
+    
+    (tmp_path / "fonts" / ".hidden").mkdir(parents=True)
+    (tmp_path / "fonts" / "sub").mkdir()
+    (tmp_path / "fonts" / "A.ttf").write_bytes(b"\0")
+    (tmp_path / "fonts" / "sub" / "B.OTF").write_bytes(b"\0")
+    (tmp_path / "fonts" / ".hidden" / "C.ttf").write_bytes(b"\0")
+    (tmp_path / "fonts" / "sub" / "readme.txt").write_text("x")
+    os.symlink(tmp_path / "fonts", tmp_path / "fonts" / "sub" / "loop")
+    
+    # 每个目录的条目按名称排序，遍历顺序确定
+    (tmp_path / "fonts" / "0.ttf").write_bytes(b"\0")
+    names = [entry.name for entry in iter_font_entries(tmp_path / "fonts", ('.ttf', '.otf'))]
+    assert names == ["0.ttf", "A.ttf", "B.OTF"]
+    print(f"✅ 扫描结果: {names}")
+
+
+def test_rescan_rebuilds_name_index():
+    """测试重新扫描后按名称查找返回新的字体对象"""
+    print("\n🔁 测试重新扫描后的名称索引...")
+    
+    from font_manager.core.models import FontInfo
+    
+    detector = FontDetector()
+    detector._disk_cache = None
+    
+    old_font = FontInfo(name="TestFont", path="/old/TestFont.ttf", family="TestFont")
+    new_font = FontInfo(name="TestFont", path="/new/TestFont.ttf", family="TestFont")
+    
+    detector._store_scan_results([], [old_font], [])
+    assert detector.find_font_by_name("TestFont") is old_font
+    
+    # 强制重新扫描得到的新对象应替换索引中的旧对象
+    detector._store_scan_results([], [new_font], [])
+    assert detector.find_font_by_name("TestFont") is new_font
+    print("✅ 重新扫描后索引已更新")
+    
+    # 清除缓存后不再保留旧的字体对象
+    detector.clear_cache()
+    assert detector.get_by_name("TestFont") is None
+    assert not detector._normalized_index
+    print("✅ 清除缓存后索引已重置")
+
+
+def test_adapter_is_chinese_font_reuses_file_size():
+    """测试中文字体判断复用已知的文件大小"""
+    print("\n🀄 测试中文字体判断...")
+    
+    adapter = FontDetector().adapter
+    font_path = Path("Courier.ttf")
+    
+    assert adapter.is_chinese_font("Noto Sans CJK", font_path)
+    # 已知文件大小时不再读取文件状态
+    assert adapter.is_chinese_font("Courier", font_path, adapter.CHINESE_FONT_SIZE_THRESHOLD + 1)
+    assert not adapter.is_chinese_font("Courier", font_path, 2048)
+    print("✅ 中文字体判断正确")
+
+def test_clear_cache_refreshes_font_dirs(tmp_path):
+    """测试清除缓存后重新检查字体目录是否存在"""
+    print("\n📁 测试字体目录刷新...")
+    
+    detector = FontDetector()
+    detector._disk_cache = None
+    adapter = detector.adapter
+    font_dir = tmp_path / "fonts"
+    
+    # 适配器为全局共享实例，测试结束后恢复原目录列表
+    original_dirs = adapter._system_font_dirs
+    adapter._system_font_dirs = [font_dir]
+    try:
+        adapter.refresh_dirs()
+        assert adapter.get_font_directories() == []
+        
+        # 运行期间新建的目录在清除缓存后被识别
+        font_dir.mkdir()
+        detector.clear_cache()
+        assert adapter.get_font_directories() == [font_dir]
+        
+        # 强制重新扫描时同样重新检查
+        font_dir.rmdir()
+        detector.detect_system_fonts(force_rescan=True)
+        assert adapter.get_font_directories() == []
+    finally:
+        adapter._system_font_dirs = original_dirs
+        adapter.refresh_dirs()
+    print("✅ 字体目录已刷新")
+
+
 def create_font_report():
     """创建字体报告"""
     print("\n📊 生成字体报告...")
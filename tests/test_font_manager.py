@@ -179,6 +179,92 @@ def test_utilities():
         return False
 
 
+def test_force_rebuild_registers_font_with_live_manager():
+    """测试强制重建后选中的字体注册在matplotlib实际使用的fontManager上"""
+    print("\n🔄 测试强制重建字体缓存...")
+    
+    from types import SimpleNamespace
+    from unittest import mock
+    
+    import matplotlib.font_manager as mpl_fm
+    
+    live_manager = mpl_fm.fontManager
+    font_path = FontManager().setup().font_used.path
+    
+    # 模拟matplotlib重新扫描系统字体，返回的列表不含选中的字体
+    fresh = SimpleNamespace(
+        ttflist=[entry for entry in live_manager.ttflist if entry.fname != font_path],
+        afmlist=list(live_manager.afmlist)
+    )
+    with mock.patch.object(mpl_fm, '_load_fontmanager', return_value=fresh) as load_fontmanager:
+        result = FontManager().setup(force_rebuild=True)
+    assert result.success
+    load_fontmanager.assert_called_once_with(try_read_cache=False)
+    
+    # findfont绑定在模块加载时的实例上，重建后必须仍是同一个实例
+    assert mpl_fm.fontManager is live_manager
+    assert mpl_fm.findfont.__self__ is mpl_fm.fontManager
+    assert sum(entry.fname == result.font_used.path for entry in mpl_fm.fontManager.ttflist) == 1
+    print(f"✅ 字体已注册: {result.font_used.name}")
+
+
+def test_repeated_setup_reapplies_rcparams():
+    """测试重复设置时重新应用被重置的matplotlib配置"""
+    print("\n♻️ 测试重复设置字体...")
+    
+    import matplotlib.font_manager as mpl_fm
+    import matplotlib.pyplot as plt
+    
+    manager = FontManager()
+    first = manager.setup()
+    assert first.success
+    expected = list(plt.rcParams['font.sans-serif'])
+    
+    # 外部重置rcParams后再次设置，应恢复字体配置
+    plt.rcdefaults()
+    assert plt.rcParams['font.sans-serif'] != expected
+    second = manager.setup()
+    assert second.success and second.font_used is first.font_used
+    assert plt.rcParams['font.sans-serif'] == expected
+    print(f"✅ 重新应用字体: {expected[0]}")
+    
+    # 健壮版设置复用已配置的字体，只重新应用rcParams
+    plt.rcdefaults()
+    robust = manager.setup_matplotlib_chinese_robust()
+    assert robust.success and robust.font_used is first.font_used
+    assert plt.rcParams['font.sans-serif'] == expected
+    
+    # 重复应用配置不会重复注册字体文件
+    assert sum(entry.fname == first.font_used.path for entry in mpl_fm.fontManager.ttflist) == 1
+    print(f"✅ 健壮版设置复用已配置字体: {robust.font_used.name}")
+
+
+def test_reset_default_manager():
+    """测试重置便捷函数共享的默认FontManager"""
+    print("\n🧹 测试重置默认字体管理器...")
+    
+    import font_manager
+    
+    assert font_manager.setup_matplotlib_chinese().success
+    first = font_manager._get_default_manager()
+    assert first.is_configured
+    
+    # 重置后重新创建实例，已配置的状态随旧实例一起丢弃
+    font_manager.reset_default_manager()
+    second = font_manager._get_default_manager()
+    assert second is not first
+    assert not second.is_configured
+    
+    # 下一次便捷调用使用新实例
+    font_manager.reset_default_manager()
+    result = font_manager.setup_matplotlib_chinese()
+    assert result.success
+    current = font_manager._get_default_manager()
+    assert current is not first and current is not second
+    assert current.is_configured and current.current_font is result.font_used
+    print(f"✅ 默认字体管理器已重建: {result.font_used.name}")
+
+
 def main():
     """主测试函数"""
     print("🚀 Font Manager 基础架构测试")
@@ -156,6 +156,11 @@ def test_matplotlib_integration():
             current = fm.get_current_theme()
             print(f"   {theme}: {'✅' if success and current == theme else '❌'}")
         
+        theme_applied = fm.apply_theme_to_matplotlib()
+        assert theme_applied
+        assert plt.rcParams['axes.titlesize'] == fm.get_font_style('title').font_size
+        print(f"✅ 主题整体应用: {'成功' if theme_applied else '失败'}")
+        
         print("3️⃣ 创建测试图表...")
         create_style_test_chart(fm)
         